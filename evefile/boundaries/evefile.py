@@ -420,7 +420,7 @@ class EveFile(File):
 
         Parameters
         ----------
-        data : :class:`list`
+        data : :class:`list` | :class:`numpy.ndarray`
             (Names/IDs of) data objects whose data should be joined.
 
             You can provide either names or IDs or the actual data objects.
@@ -455,16 +455,23 @@ class EveFile(File):
             :class:`evefile.entities.data.MeasureData`.
 
         """
+        if data is not None:
+            data = list(data)
         if not data:
             data = list(self.data.values())
-        data = [
-            (
-                self._convert_str_to_data_object(item)
-                if isinstance(item, str)
-                else item
-            )
-            for item in data
-        ]
+        else:
+            names = None
+            for idx, item in enumerate(data):
+                if not isinstance(item, str):
+                    continue
+                if names is None:
+                    names = {
+                        value.metadata.name: key
+                        for key, value in self.data.items()
+                    }
+                data[idx] = self._convert_str_to_data_object(
+                    item, names=names
+                )
         if include_monitors:
             monitors = self.get_monitors()
             if isinstance(monitors, list):
@@ -474,16 +481,17 @@ class EveFile(File):
         joiner = self._join_factory.get_join(mode=mode)
         return joiner.join(data)
 
-    def _convert_str_to_data_object(self, name_or_id=""):
-        try:
-            result = self.data[name_or_id]
-        except KeyError:
-            try:
-                result = self.get_data(name_or_id)
-            except KeyError:
-                # Valid situation: monitor
-                result = self.get_monitors(name_or_id)
-        return result
+    def _convert_str_to_data_object(self, name_or_id="", names=None):
+        if name_or_id in self.data:
+            return self.data[name_or_id]
+        if names is None:
+            names = {
+                item.metadata.name: key for key, item in self.data.items()
+            }
+        if name_or_id in names:
+            return self.data[names[name_or_id]]
+        # Valid situation: monitor
+        return self.get_monitors(name_or_id)
 
     def get_dataframe(
         self, data=None, mode="AxisOrChannelPositions", include_monitors=False
@@ -521,7 +529,7 @@ class EveFile(File):
 
         Parameters
         ----------
-        data : :class:`list`
+        data : :class:`list` | :class:`numpy.ndarray`
             (Names/IDs of) data objects whose data should be included.
 
             You can provide either names or IDs or the actual data objects.
@@ -560,6 +568,8 @@ class EveFile(File):
             respective datasets.
 
         """
+        if data is not None:
+            data = list(data)
         if not data:
             data = list(self.data.values())
         joined_data = self.get_joined_data(
@@ -673,14 +683,11 @@ class EveFile(File):
             :class:`evefile.entities.data.DeviceData`.
 
         """
-        device_data = []
         if not monitors:
             monitors = list(self.monitors)
-        if isinstance(monitors, (list, tuple)):
-            for item in monitors:
-                device_data.append(self._monitor_mapper.map(item))
-        else:
-            device_data.append(self._monitor_mapper.map(monitors))
+        if not isinstance(monitors, (list, tuple)):
+            monitors = [monitors]
+        device_data = self._monitor_mapper.map_all(monitors=monitors)
         if len(device_data) == 1:
             device_data = device_data[0]
         return device_data
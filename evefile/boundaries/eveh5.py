@@ -328,16 +328,32 @@ class HDF5Item:
         if not self.name:
             raise ValueError("Missing attribute name")
         with self._hdf5_file() as file:
-            try:
-                self.attributes = {
-                    key: value[0].decode()
-                    for key, value in file[self.name].attrs.items()  # noqa
-                }
-            except UnicodeDecodeError:
-                self.attributes = {
-                    key: value[0].decode(encoding="iso8859")
-                    for key, value in file[self.name].attrs.items()  # noqa
-                }
+            self.attributes = self._decode_attributes(file[self.name].attrs)
+
+    @staticmethod
+    def _decode_attributes(attributes):
+        """
+        Convert the attributes of an HDF5 item into (unicode) strings.
+
+        Parameters
+        ----------
+        attributes : :class:`h5py.AttributeManager`
+            Attributes of an HDF5 item, as obtained from h5py
+
+        Returns
+        -------
+        attributes : :class:`dict`
+            Attributes with their values converted into strings
+
+        """
+        attributes = attributes.items()
+        try:
+            return {key: value[0].decode() for key, value in attributes}
+        except UnicodeDecodeError:
+            return {
+                key: value[0].decode(encoding="iso8859")
+                for key, value in attributes
+            }
 
     @contextmanager
     def _hdf5_file(self):
@@ -477,7 +493,7 @@ class HDF5Dataset(HDF5Item):
             NumPy dtype object of the dataset
 
         """
-        if not self._dtype:
+        if self._dtype is None:
             if not self.filename:
                 raise ValueError("Missing attribute filename")
             if not self.name:
@@ -502,7 +518,7 @@ class HDF5Dataset(HDF5Item):
             Shape of the dataset
 
         """
-        if not self._shape:
+        if self._shape is None:
             if not self.filename:
                 raise ValueError("Missing attribute filename")
             if not self.name:
@@ -538,6 +554,36 @@ class HDF5Dataset(HDF5Item):
         with self._hdf5_file() as file:
             self._data = file[self.name][...]
 
+    def get_first_row(self):
+        """
+        Get the first row of the HDF5 dataset.
+
+        Some datasets store metadata in each of their rows, and only the
+        first row is of interest. Hence, if no data have been read before,
+        only the first row is read from the HDF5 file, and the
+        :attr:`data` attribute is left untouched.
+
+        Returns
+        -------
+        row : :class:`numpy.void` | :class:`numpy.ndarray`
+            First row of the dataset
+
+        Raises
+        ------
+        ValueError
+            Raised if either filename or name are not provided and data are
+            read from the HDF5 file.
+
+        """
+        if self._data.size > 0:
+            return self._data[0]
+        if not self.filename:
+            raise ValueError("Missing attribute filename")
+        if not self.name:
+            raise ValueError("Missing attribute name")
+        with self._hdf5_file() as file:
+            return file[self.name][0]
+
 
 class HDF5Group(HDF5Item):
     # noinspection PyUnresolvedReferences
@@ -806,6 +852,8 @@ class HDF5File(HDF5Group):
         self.read_attributes = False
         self.close_file = True
         self._hdf5_items = {}
+        self._hdf5_attributes = {}
+        self._hdf5_dtypes = {}
 
     def read(self, filename=""):
         """
@@ -863,6 +911,12 @@ class HDF5File(HDF5Group):
         provided by the h5py package is used. This should be much faster
         than any iteration on the Python side, as this mainly works on the
         HDF5 (*i.e.*, C++) side.
+
+        If attributes should be read, they are read in the same pass,
+        as the visitor provides the opened HDF5 object anyway. Otherwise,
+        each item would need to be looked up and opened again by its path.
+        The same holds true for the dtype of each dataset, that is needed
+        for mapping the datasets and hence always read.
         """
 
         def inspect(name, item):
@@ -870,7 +924,12 @@ class HDF5File(HDF5Group):
                 item_type = HDF5Group
             else:
                 item_type = HDF5Dataset
+                self._hdf5_dtypes[name] = item.dtype
             self._hdf5_items[name] = item_type
+            if self.read_attributes:
+                self._hdf5_attributes[name] = self._decode_attributes(
+                    item.attrs
+                )
 
         with self._hdf5_file() as file:
             file.visititems(inspect)
@@ -889,7 +948,9 @@ class HDF5File(HDF5Group):
             item = node_type(filename=self.filename, name=f"/{name}")
             item._hdf5_filehandle = self._hdf5_filehandle  # noqa
             if self.read_attributes:
-                item.get_attributes()
+                item.attributes = self._hdf5_attributes[name]
+            if name in self._hdf5_dtypes:
+                item._dtype = self._hdf5_dtypes[name]  # noqa
             if "/" not in name:
                 self.add_item(item)
             else:
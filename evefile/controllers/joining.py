@@ -465,17 +465,340 @@ Module documentation
 
 """
 
-import copy
 import logging
-from functools import reduce
+from functools import lru_cache
 
 import numpy as np
+from numpy import ma
 
 import evefile.entities
 import evefile.entities.data
 
 logger = logging.getLogger(__name__)
 
+_BITMAP_DENSITY = 0.1
+_MERGE_RATIO = 0.1
+
+
+def _shallow_clone(obj):
+    """
+    Create a shallow copy of a data object.
+
+    Compared to :func:`copy.copy`, the generic copy protocol machinery is
+    bypassed: a new instance of the same class is created and gets a copy
+    of the instance dictionary of the original object. Hence, all
+    attributes, including data arrays, are shared with the original
+    object. As joining (re)assigns the data and positions rather than
+    modifying the arrays in place, the original object remains unaltered.
+
+    Parameters
+    ----------
+    obj : :class:`object`
+        Object to create a shallow copy of
+
+    Returns
+    -------
+    clone : :class:`object`
+        Shallow copy of the object
+
+    """
+    clone = object.__new__(type(obj))
+    clone.__dict__ = obj.__dict__.copy()
+    return clone
+
+
+@lru_cache(maxsize=None)
+def _join_base_class(cls):
+    """
+    Base class relevant for joining a data object of the given class.
+
+    The result is cached per class, hence the class hierarchy needs to be
+    inspected only once per class rather than for each data object.
+
+    Parameters
+    ----------
+    cls : :class:`type`
+        Class of the data object
+
+    Returns
+    -------
+    base_class : :class:`type` | None
+        One of :class:`evefile.entities.data.ChannelData`,
+        :class:`evefile.entities.data.AxisData`, and
+        :class:`evefile.entities.data.DeviceData`.
+
+        None if the class is not derived from any of them.
+
+    """
+    for base_class in (
+        evefile.entities.data.ChannelData,
+        evefile.entities.data.AxisData,
+        evefile.entities.data.DeviceData,
+    ):
+        if issubclass(cls, base_class):
+            return base_class
+    return None
+
+
+def _bitmap_range(arrays):
+    """
+    Lower bound and size of a bitmap covering dense integer positions.
+
+    Position counts are integers usually covering a contiguous range with
+    only few gaps. In this case, set operations can be performed on a
+    (boolean) bitmap indexed by position rather than by sorting. As the
+    arrays are sorted, the range is obtained from their first and last
+    positions, without concatenating them.
+
+    Parameters
+    ----------
+    arrays : :class:`list`
+        Position arrays (:class:`numpy.ndarray`), each with sorted values,
+        the bitmap should cover
+
+    Returns
+    -------
+    range : :class:`tuple` | None
+        Lower bound and size of the bitmap.
+
+        None if the positions are not integers or too sparse, *i.e.*
+        the number of positions is below :data:`_BITMAP_DENSITY` times
+        the size of the bitmap.
+
+    """
+    arrays = [array for array in arrays if array.size]
+    if not arrays or not all(
+        np.issubdtype(array.dtype, np.integer) for array in arrays
+    ):
+        return None
+    lower = min(array[0] for array in arrays)
+    size = int(max(array[-1] for array in arrays) - lower) + 1
+    if sum(array.size for array in arrays) < _BITMAP_DENSITY * size:
+        return None
+    return lower, size
+
+
+def _as_positions(positions):
+    """
+    Convert integer positions to a contiguous array of 64-bit integers.
+
+    Depending on the file they have been read from, position counts may
+    come with different integer types. Binary searches and comparisons
+    of arrays with different types cast one of the arrays for every call.
+    Converting all positions once upfront avoids these repeated casts.
+
+    Parameters
+    ----------
+    positions : :class:`numpy.ndarray`
+        Positions to convert
+
+    Returns
+    -------
+    positions : :class:`numpy.ndarray`
+        Positions as contiguous 64-bit integers if they are integers,
+        otherwise unaltered.
+
+    """
+    positions = np.asarray(positions)
+    if not np.issubdtype(positions.dtype, np.integer):
+        return positions
+    return np.ascontiguousarray(positions, dtype=np.int64)
+
+
+def _narrow(positions):
+    """
+    Convert integer positions to the narrowest integer type they fit in.
+
+    Position counts rarely exceed the range of 32-bit integers. Sorting
+    32-bit rather than 64-bit integers halves the memory traffic.
+
+    Parameters
+    ----------
+    positions : :class:`numpy.ndarray`
+        Positions to convert
+
+    Returns
+    -------
+    positions : :class:`numpy.ndarray`
+        Positions as 32-bit integers if they fit, otherwise unaltered.
+
+    """
+    if (
+        not positions.size
+        or not np.issubdtype(positions.dtype, np.integer)
+        or positions.dtype.itemsize <= 4
+    ):
+        return positions
+    limits = np.iinfo(np.int32)
+    if positions.min() < limits.min or positions.max() > limits.max:
+        return positions
+    return positions.astype(np.int32)
+
+
+def _identical(arrays):
+    """
+    Check whether all position arrays are identical.
+
+    Joining data sharing the same positions is a rather common case,
+    *e.g.* for axes and channels of the same scan module. Comparing the
+    arrays is much cheaper than any set operation on them.
+
+    Parameters
+    ----------
+    arrays : :class:`list`
+        Position arrays (:class:`numpy.ndarray`)
+
+    Returns
+    -------
+    identical : :class:`bool`
+        Whether all arrays contain the same positions
+
+    """
+    first = arrays[0]
+    return all(
+        array is first
+        or (len(array) == len(first) and np.array_equal(array, first))
+        for array in arrays[1:]
+    )
+
+
+def _union(arrays):
+    """
+    Set union of position arrays, sorted in ascending order.
+
+    For dense integer positions, a bitmap is set for the positions of
+    each array in turn and the union read from it in one pass, avoiding
+    any sorting and keeping only one array at a time in flight. Otherwise,
+    the concatenated arrays are sorted using a stable sort (timsort),
+    that detects and merges the already sorted runs of the individual
+    arrays in linear time per run rather than sorting from scratch.
+    Duplicates are removed afterwards by comparing neighbours.
+
+    Parameters
+    ----------
+    arrays : :class:`list`
+        Position arrays (:class:`numpy.ndarray`), each with sorted unique
+        values.
+
+    Returns
+    -------
+    union : :class:`numpy.ndarray`
+        Sorted unique positions contained in any of the arrays.
+
+    """
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    if _identical(arrays):
+        return arrays[0].copy()
+    bitmap_range = _bitmap_range(arrays)
+    if bitmap_range is None:
+        positions = np.sort(_narrow(np.concatenate(arrays)), kind="stable")
+        unique = np.ones(positions.shape, dtype=bool)
+        np.not_equal(positions[1:], positions[:-1], out=unique[1:])
+        return positions[unique]
+    lower, size = bitmap_range
+    bitmap = np.zeros(size, dtype=bool)
+    for array in arrays:
+        if array.size:
+            bitmap[array - lower] = True
+    return np.flatnonzero(bitmap) + lower
+
+
+def _pairwise_intersection(candidates, array):
+    """
+    Set intersection of two sorted position arrays.
+
+    Few candidates are looked up in the (longer) array by binary search,
+    with costs growing only logarithmically with the length of the array.
+    For candidates of comparable length, both arrays are merged instead,
+    as a stable sort (timsort) merges the two sorted runs in linear time,
+    and common positions end up next to each other.
+
+    Parameters
+    ----------
+    candidates : :class:`numpy.ndarray`
+        Sorted unique positions, usually the shorter of both arrays
+
+    array : :class:`numpy.ndarray`
+        Sorted unique positions
+
+    Returns
+    -------
+    intersection : :class:`numpy.ndarray`
+        Sorted positions contained in both arrays.
+
+    """
+    if len(candidates) < _MERGE_RATIO * len(array):
+        indices = np.searchsorted(array, candidates)
+        indices[indices == len(array)] = 0
+        return candidates[array[indices] == candidates]
+    merged = np.sort(np.concatenate((candidates, array)), kind="stable")
+    return merged[1:][merged[1:] == merged[:-1]]
+
+
+def _intersection(arrays):
+    """
+    Set intersection of position arrays, sorted in ascending order.
+
+    Only positions within the range covered by all arrays can be common
+    to all of them. Hence, the arrays are cropped to this range first,
+    and if the ranges do not overlap, the intersection is empty without
+    looking at any further positions.
+
+    For dense integer positions, the occurrences of each position are
+    counted array by array in a bitmap-like array, and only positions
+    present in all arrays retained. Otherwise, starting with the shortest
+    array, the remaining candidates are intersected with each other array
+    in turn, shrinking the candidates as fast as possible. In both cases,
+    it is relied upon positions being sorted and unique for each data
+    object.
+
+    Parameters
+    ----------
+    arrays : :class:`list`
+        Position arrays (:class:`numpy.ndarray`), each with sorted unique
+        values.
+
+    Returns
+    -------
+    intersection : :class:`numpy.ndarray`
+        Sorted positions contained in all the arrays.
+
+    """
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    if _identical(arrays):
+        return arrays[0].copy()
+    if not all(array.size for array in arrays):
+        return np.empty(0, dtype=np.int64)
+    lower = max(array[0] for array in arrays)
+    upper = min(array[-1] for array in arrays)
+    if lower > upper:
+        return np.empty(0, dtype=np.int64)
+    cropped = []
+    for array in arrays:
+        start = np.searchsorted(array, lower)
+        stop = np.searchsorted(array, upper, side="right")
+        cropped.append(array[start:stop])
+    arrays = cropped
+    bitmap_range = _bitmap_range(arrays)
+    if bitmap_range is None:
+        arrays = sorted(arrays, key=len)
+        result = arrays[0]
+        for array in arrays[1:]:
+            if not result.size:
+                break
+            result = _pairwise_intersection(result, array)
+        return result
+    lower, size = bitmap_range
+    # Positions are unique for each array, hence incrementing via fancy
+    # indexing counts each position exactly once per array.
+    counts = np.zeros(size, dtype=np.min_scalar_type(len(arrays)))
+    for array in arrays:
+        if array.size:
+            counts[array - lower] += 1
+    return np.flatnonzero(counts == len(arrays)) + lower
+
 
 class Join:
     """
@@ -514,6 +837,12 @@ class Join:
     file : :class:`evefile.boundaries.evefile.EveFile`
         EveFile object the join should be performed for.
 
+    snapshot_cache : :class:`dict`
+        Cache for snapshot values merged into axes.
+
+        Allows several joins for the same file to merge snapshot values
+        only once. If not provided, a new (empty) cache is used.
+
 
     Examples
     --------
@@ -536,12 +865,18 @@ class Join:
 
     """
 
-    def __init__(self, file=None):
+    def __init__(self, file=None, snapshot_cache=None):
         self._channel_indices = []
         self._axes = []
         self._channels = []
         self._devices = []
+        self._axis_positions = []
+        self._axis_values = []
+        self._channel_positions = []
         self._result_positions = None
+        if snapshot_cache is None:
+            snapshot_cache = {}
+        self._snapshot_cache = snapshot_cache
         self.file = file
 
     def join(self, data=None):
@@ -559,7 +894,7 @@ class Join:
 
         Parameters
         ----------
-        data : :class:`list`
+        data : :class:`list` | :class:`numpy.ndarray`
             (Names of the) data objects to join.
 
             You can provide a list of either names or IDs of data objects or
@@ -580,12 +915,15 @@ class Join:
         """
         if not self.file:
             raise ValueError("Need an evefile to join data.")
+        if data is not None:
+            data = list(data)
         if not data:
             raise ValueError("Need data to join data.")
         return self._join(data=data)
 
     def _join(self, data=None):
         self._sort_data(data)
+        self._collect_arrays()
         self._assign_result_positions()
         self._fill_axes()
         self._fill_channels()
@@ -593,40 +931,217 @@ class Join:
         return self._assign_result()
 
     def _sort_data(self, data):
+        self._channel_indices = []
+        self._axes = []
+        self._channels = []
+        self._devices = []
+        buckets = {
+            evefile.entities.data.ChannelData: self._channels,
+            evefile.entities.data.AxisData: self._axes,
+            evefile.entities.data.DeviceData: self._devices,
+        }
         for idx, item in enumerate(data):
-            if isinstance(item, evefile.entities.data.ChannelData):
-                self._channels.append(copy.copy(item))
+            base_class = _join_base_class(type(item))
+            if base_class is None:
+                continue
+            buckets[base_class].append(item)
+            if base_class is evefile.entities.data.ChannelData:
                 self._channel_indices.append(idx)
-            if isinstance(item, evefile.entities.data.AxisData):
-                self._axes.append(copy.copy(item))
-            if isinstance(item, evefile.entities.data.DeviceData):
-                self._devices.append(copy.copy(item))
+
+    def _collect_arrays(self):
+        # Access positions and values only once per data object, as
+        # accessing them may trigger loading data. Keeping them in parallel
+        # lists avoids repeated attribute lookups in the loops later on.
+        # Data are accessed on the original data objects before cloning
+        # them, hence imported data are kept and reused by later joins.
+        # All data are loaded from one open file.
+        with evefile.entities.data.HDF5DataImporter.keep_files_open():
+            self._axis_positions = [
+                _as_positions(item.position_counts) for item in self._axes
+            ]
+            # Keep masks of axes that have been joined before.
+            self._axis_values = [
+                (
+                    item.data
+                    if ma.isMaskedArray(item.data)
+                    else np.asarray(item.data)
+                )
+                for item in self._axes
+            ]
+            self._channel_positions = [
+                _as_positions(item.position_counts) for item in self._channels
+            ]
+            # Positions of devices are not needed here, but accessing them
+            # loads the data of devices, if not loaded already, from the
+            # open file.
+            for item in self._devices:
+                _ = item.position_counts
+        self._axes = [_shallow_clone(item) for item in self._axes]
+        self._channels = [_shallow_clone(item) for item in self._channels]
+        self._devices = [_shallow_clone(item) for item in self._devices]
 
     def _assign_result_positions(self):
         pass
 
     def _fill_axes(self):
-        for axis in self._axes:
-            if axis.metadata.id in self.file.snapshots:
-                axis.join(
-                    positions=self._result_positions,
-                    snapshot=self.file.snapshots[axis.metadata.id],
+        snapshots = self.file.snapshots
+        axes = []
+        for axis, positions, values in zip(
+            self._axes, self._axis_positions, self._axis_values
+        ):
+            snapshot = snapshots.get(axis.metadata.id)
+            if snapshot is not None:
+                positions, values = self._merge_snapshot(
+                    axis, positions, values, snapshot
                 )
-            else:
-                axis.join(positions=self._result_positions, fill=True)
+            axes.append((axis, positions, values))
+        self._gather_axes(axes)
+
+    def _merge_snapshot(self, axis, positions, values, snapshot):
+        """
+        Merge snapshot positions and values into those of an axis.
+
+        Merging requires inserting into the arrays, *i.e.* copying them.
+        As the same axes are usually joined repeatedly for one file,
+        the merged arrays are cached and reused as long as neither the
+        axis nor the snapshot arrays have been replaced. As the cache is
+        shared between joins, the merged arrays are read-only and need to
+        be copied before handing them out.
+
+        Parameters
+        ----------
+        axis : :class:`evefile.entities.data.AxisData`
+            Axis the snapshot belongs to
+
+        positions : :class:`numpy.ndarray`
+            Positions of the axis, converted to contiguous integers
+
+        values : :class:`numpy.ndarray`
+            Values of the axis
+
+        snapshot : :class:`evefile.entities.data.AxisData`
+            Snapshot corresponding to the axis
+
+        Returns
+        -------
+        positions : :class:`numpy.ndarray`
+            Positions of axis and snapshot
+
+        values : :class:`numpy.ndarray`
+            Values of axis and snapshot
+
+        """
+        # Positions are converted anew for every join, hence compare the
+        # positions of the axis itself for detecting whether it changed.
+        key = axis.metadata.id
+        sources = (
+            axis.position_counts,
+            values,
+            snapshot.position_counts,
+            snapshot.data,
+        )
+        cached = self._snapshot_cache.get(key)
+        if cached is not None and all(
+            source is cached_source
+            for source, cached_source in zip(sources, cached[0])
+        ):
+            return cached[1]
+        insert_positions = np.searchsorted(positions, sources[2])
+        merged_values = np.insert(
+            ma.getdata(values), insert_positions, sources[3]
+        )
+        if ma.isMaskedArray(values):
+            merged_values = ma.masked_array(
+                merged_values,
+                mask=np.insert(
+                    ma.getmaskarray(values), insert_positions, False
+                ),
+            )
+        merged = (
+            np.insert(positions, insert_positions, sources[2]),
+            merged_values,
+        )
+        for array in merged:
+            array.flags.writeable = False
+        self._snapshot_cache[key] = (sources, merged)
+        return merged
+
+    def _gather_axes(self, axes):
+        """
+        Fill axes values with previous values in one batch per data type.
+
+        Axes are filled with the previous value present for a given
+        position, as in :meth:`AxisData.join()
+        <evefile.entities.data.AxisData.join>` with ``fill=True``,
+        with snapshot values already merged into positions and values.
+        Rather than creating temporary arrays for each axis, the values of
+        all axes sharing the same data type are written directly into the
+        rows of a single preallocated 2D array. Positions without previous
+        value are masked.
+
+        Parameters
+        ----------
+        axes : :class:`list`
+            Tuples of axes (:obj:`evefile.entities.data.AxisData`) to be
+            filled, their positions, and their values.
+
+        """
+        groups = {}
+        for axis, positions, data in axes:
+            if _identical([positions, self._result_positions]):
+                # Values may contain merged snapshot values. Copy them, as
+                # they may be the values of the original axis.
+                axis.position_counts = self._result_positions
+                axis.data = data.copy()
+                continue
+            groups.setdefault(data.dtype, []).append((axis, positions, data))
+        n_positions = len(self._result_positions)
+        for dtype, group in groups.items():
+            values = np.empty((len(group), n_positions), dtype=dtype)
+            for idx, (axis, positions, data) in enumerate(group):
+                indices = (
+                    np.searchsorted(
+                        positions,
+                        self._result_positions,
+                        side="right",
+                    )
+                    - 1
+                )
+                missing = indices < 0
+                indices = np.maximum(indices, 0)
+                np.take(ma.getdata(data), indices, out=values[idx])
+                if ma.isMaskedArray(data):
+                    missing |= np.take(ma.getmaskarray(data), indices)
+                axis.position_counts = self._result_positions
+                if missing.any():
+                    axis.data = ma.masked_array(values[idx], mask=missing)
+                else:
+                    axis.data = values[idx]
 
     def _fill_channels(self):
+        result_positions = self._result_positions
         for channel in self._channels:
-            channel.join(positions=self._result_positions)
+            channel.join(positions=result_positions)
 
     def _fill_devices(self):
+        result_positions = self._result_positions
         for device in self._devices:
-            device.join(positions=self._result_positions)
+            device.join(positions=result_positions)
 
     def _assign_result(self):
-        result = [*self._axes]
-        for idx, item in enumerate(self._channels):
-            result.insert(self._channel_indices[idx], item)
+        # Merge axes and channels in one pass, placing channels at their
+        # original index (as far as possible), instead of repeatedly
+        # inserting into a list.
+        result = []
+        axes = iter(self._axes)
+        for channel, index in zip(self._channels, self._channel_indices):
+            while len(result) < index:
+                axis = next(axes, None)
+                if axis is None:
+                    break
+                result.append(axis)
+            result.append(channel)
+        result.extend(axes)
         result.extend(self._devices)
         return result
 
@@ -718,9 +1233,8 @@ class ChannelPositions(Join):
     """
 
     def _assign_result_positions(self):
-        channel_positions = [item.position_counts for item in self._channels]
-        self._result_positions = reduce(np.union1d, channel_positions).astype(
-            np.int64
+        self._result_positions = _union(self._channel_positions).astype(
+            np.int64, copy=False
         )
 
 
@@ -810,9 +1324,8 @@ class AxisPositions(Join):
     """
 
     def _assign_result_positions(self):
-        axis_positions = [item.position_counts for item in self._axes]
-        self._result_positions = reduce(np.union1d, axis_positions).astype(
-            np.int64
+        self._result_positions = _union(self._axis_positions).astype(
+            np.int64, copy=False
         )
 
 
@@ -905,10 +1418,9 @@ class AxisAndChannelPositions(Join):
     """
 
     def _assign_result_positions(self):
-        positions = [item.position_counts for item in self._axes]
-        positions.extend([item.position_counts for item in self._channels])
-        self._result_positions = reduce(np.intersect1d, positions).astype(
-            np.int64
+        positions = [*self._axis_positions, *self._channel_positions]
+        self._result_positions = _intersection(positions).astype(
+            np.int64, copy=False
         )
 
 
@@ -1002,13 +1514,24 @@ class AxisOrChannelPositions(Join):
     """
 
     def _assign_result_positions(self):
-        positions = [item.position_counts for item in self._axes]
-        positions.extend([item.position_counts for item in self._channels])
-        self._result_positions = reduce(np.union1d, positions).astype(
-            np.int64
+        positions = [*self._axis_positions, *self._channel_positions]
+        self._result_positions = _union(positions).astype(
+            np.int64, copy=False
         )
 
 
+_JOIN_MODES = {
+    cls.__name__: cls
+    for cls in (
+        Join,
+        ChannelPositions,
+        AxisPositions,
+        AxisAndChannelPositions,
+        AxisOrChannelPositions,
+    )
+}
+
+
 class JoinFactory:
     """
     Factory for getting the correct join object.
@@ -1066,6 +1589,7 @@ class JoinFactory:
 
     def __init__(self, file=None):
         self.file = file
+        self._snapshot_cache = {}
 
     def get_join(self, mode="Join"):
         """
@@ -1090,6 +1614,17 @@ class JoinFactory:
         join : :class:`Join`
             Join instance
 
+        Raises
+        ------
+        ValueError
+            Raised if the mode is unknown.
+
         """
-        instance = globals()[mode](file=self.file)
-        return instance
+        if mode not in _JOIN_MODES:
+            raise ValueError(
+                f"Unknown join mode '{mode}', must be one of: "
+                f"{', '.join(_JOIN_MODES)}"
+            )
+        return _JOIN_MODES[mode](
+            file=self.file, snapshot_cache=self._snapshot_cache
+        )
@@ -59,8 +59,6 @@ Module documentation
 
 """
 
-import copy
-
 import numpy as np
 
 import evefile.entities.data
@@ -119,6 +117,16 @@ class Mapper:
     timestamps mapped to position counts. See the :meth:`map` method for
     further details of the actual mapping.
 
+    To map several monitor datasets at once, use the :meth:`map_all`
+    method instead, returning a list of device datasets:
+
+    .. code-block::
+
+        mapper = Mapper(file=evefile)
+        device_data = mapper.map_all(["DetP5000:gw2370700.STAT", ...])
+
+    If no monitors are provided, all monitors of the file are mapped.
+
     """
 
     def __init__(self, file=None):
@@ -164,24 +172,75 @@ class Mapper:
             raise ValueError("Need an evefile to map data.")
         if not monitor:
             raise ValueError("Need monitor to map timestamps to positions.")
-        monitor_data = self.file.monitors[monitor]
+        return self.map_all(monitors=[monitor])[0]
+
+    def map_all(self, monitors=None):
+        """
+        Map several monitor datasets to device data datasets at once.
+
+        Mapping works as described for :meth:`map`. However, the
+        timestamps of all monitors are mapped to position counts in one
+        go, rather than searching the position timestamps separately for
+        each monitor.
+
+        Parameters
+        ----------
+        monitors : :class:`list`
+            IDs of the monitor datasets to map
+
+            If no monitors are provided, all monitors of the file are mapped.
+
+        Returns
+        -------
+        device_data : :class:`list`
+            Device data with mapped position counts instead of timestamps
+
+            Each item is a :class:`evefile.entities.data.DeviceData` object,
+            in the same order as the monitors provided.
+
+        Raises
+        ------
+        ValueError
+            Raised if no evefile is present
+
+        """
+        if not self.file:
+            raise ValueError("Need an evefile to map data.")
+        if monitors is None:
+            monitors = list(self.file.monitors)
+        device_data = []
+        milliseconds = []
+        for monitor in monitors:
+            item, item_milliseconds = self._map_values(
+                self.file.monitors[monitor]
+            )
+            device_data.append(item)
+            milliseconds.append(item_milliseconds)
+        if not device_data:
+            return device_data
+        positions = self.file.position_timestamps.get_position(
+            np.concatenate(milliseconds)
+        )
+        boundaries = np.cumsum([len(item) for item in milliseconds[:-1]])
+        for item, item_positions in zip(
+            device_data, np.split(positions, boundaries)
+        ):
+            item.position_counts = item_positions
+        return device_data
+
+    @staticmethod
+    def _map_values(monitor_data):
         # Need to force load data before mapping
         monitor_data.get_data()
         device_data = evefile.entities.data.DeviceData()
         device_data.metadata.copy_attributes_from(monitor_data.metadata)
-        # Take only second of each duplicate value
-        indices = np.where(
-            np.diff(
-                [
-                    *monitor_data.milliseconds,
-                    monitor_data.milliseconds[-1] + 1,
-                ]
-            )
-        )
-        device_data.position_counts = (
-            self.file.position_timestamps.get_position(
-                monitor_data.milliseconds[indices]
-            )
-        )
-        device_data.data = copy.copy(monitor_data.data[indices])
-        return device_data
+        milliseconds = monitor_data.milliseconds
+        # Take only last of each duplicate value
+        keep = np.ones(milliseconds.shape, dtype=bool)
+        np.not_equal(milliseconds[1:], milliseconds[:-1], out=keep[:-1])
+        if keep.all():
+            device_data.data = monitor_data.data.copy()
+            return device_data, milliseconds
+        # Indexing with a boolean mask always returns a copy
+        device_data.data = monitor_data.data[keep]
+        return device_data, milliseconds[keep]
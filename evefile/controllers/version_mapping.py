@@ -187,7 +187,6 @@ Module documentation
 
 import datetime
 import logging
-import sys
 from collections.abc import Iterable
 
 import numpy as np
@@ -196,6 +195,46 @@ from evefile import entities
 
 logger = logging.getLogger(__name__)
 
+# Importer mappings shared by all monitors and by all datasets with
+# position counts as first column. Never modify these dicts in place.
+_MONITOR_MAPPING = {0: "milliseconds", 1: "data"}
+_POSITIONS_MAPPING = {0: "position_counts", 1: "data"}
+
+# Importer mappings for additional data of channels and for array data,
+# shared the same way as the mappings above
+_ARRAY_MAPPING = {0: "data"}
+_NORMALIZED_MAPPING = {1: "normalized_data"}
+_NORMALIZING_MAPPING = {1: "normalizing_data"}
+_COUNTS_MAPPING = {1: "counts"}
+_STD_MAPPING = {2: "std"}
+_ATTEMPTS_MAPPING = {1: "attempts"}
+_MCA_OPTION_MAPPINGS = {
+    "ELTM": {1: "life_time"},
+    "ERTM": {1: "real_time"},
+}
+
+# Subgroups of the main section containing additional data of channels
+_GROUPS_IN_MAIN = frozenset({"normalized", "averagemeta", "standarddev"})
+
+# File metadata attributes and the attributes of the root and c1 group
+# of an eveH5 file they are mapped from.
+_ROOT_METADATA_MAPPING = (
+    ("eveh5_version", "EVEH5Version"),
+    ("eve_version", "Version"),
+    ("xml_version", "XMLversion"),
+    ("measurement_station", "Location"),
+    ("description", "Comment"),
+)
+_C1_METADATA_MAPPING = (
+    ("preferred_axis", "preferredAxis"),
+    ("preferred_channel", "preferredChannel"),
+    ("preferred_normalisation_channel", "preferredNormalizationChannel"),
+)
+_DATE_METADATA_MAPPING = (
+    ("start", "StartTimeISO"),
+    ("end", "EndTimeISO"),
+)
+
 
 class VersionMapperFactory:
     """
@@ -271,19 +310,16 @@ class VersionMapperFactory:
             Raised if no matching :class:`VersionMapper` class can be found
 
         """
-        if eveh5:
+        if eveh5 is not None:
             self.eveh5 = eveh5
-        if not self.eveh5:
+        if self.eveh5 is None:
             raise ValueError("Missing eveh5 object")
-        version = self.eveh5.attributes["EVEH5Version"].split(".")[0]
-        try:
-            mapper = getattr(
-                sys.modules[__name__], f"VersionMapperV{version}"
-            )()
-        except AttributeError as exc:
+        version = self.eveh5.attributes["EVEH5Version"].partition(".")[0]
+        if version not in _VERSION_MAPPERS:
             message = f"No mapper for version {version}"
             logger.error(message)
-            raise AttributeError(message) from exc
+            raise AttributeError(message)
+        mapper = _VERSION_MAPPERS[version]()
         mapper.source = self.eveh5
         return mapper
 
@@ -308,30 +344,30 @@ class VersionMapper:
     destination : :class:`evefile.boundaries.evefile.EveFile`
         High(er)-level evefile structure representing an eveH5 file
 
-    datasets2map_in_main : :class:`list`
+    datasets2map_in_main : :class:`set`
         Names of the datasets in the main section not yet mapped.
 
         In order to not have to check all datasets several times,
-        this list contains only those datasets not yet mapped. Hence,
-        every private mapping method removes those names from the list it
+        this set contains only those datasets not yet mapped. Hence,
+        every private mapping method removes those names from the set it
         handled successfully.
 
-    datasets2map_in_snapshot : :class:`list`
+    datasets2map_in_snapshot : :class:`set`
         Names of the datasets in the snapshot section not yet mapped.
 
         In order to not have to check all datasets several times,
-        this list contains only those datasets not yet mapped. Hence,
-        every private mapping method removes those names from the list it
+        this set contains only those datasets not yet mapped. Hence,
+        every private mapping method removes those names from the set it
         handled successfully.
 
-    datasets2map_in_monitor : :class:`list`
+    datasets2map_in_monitor : :class:`set`
         Names of the datasets in the monitor section not yet mapped.
 
         Note that the monitor section is usually termed "device".
 
         In order to not have to check all datasets several times,
-        this list contains only those datasets not yet mapped. Hence,
-        every private mapping method removes those names from the list it
+        this set contains only those datasets not yet mapped. Hence,
+        every private mapping method removes those names from the set it
         handled successfully.
 
     Raises
@@ -366,9 +402,9 @@ class VersionMapper:
     def __init__(self):
         self.source = None
         self.destination = None
-        self.datasets2map_in_main = []
-        self.datasets2map_in_snapshot = []
-        self.datasets2map_in_monitor = []
+        self.datasets2map_in_main = set()
+        self.datasets2map_in_snapshot = set()
+        self.datasets2map_in_monitor = set()
         self._main_group = None
         self._snapshot_group = None
         self._monitor_group = None
@@ -391,9 +427,9 @@ class VersionMapper:
             Raised if either source or destination are not provided
 
         """
-        if source:
+        if source is not None:
             self.source = source
-        if destination:
+        if destination is not None:
             self.destination = destination
         self._check_prerequisites()
         self._set_dataset_names()
@@ -463,17 +499,19 @@ class VersionMapper:
             HDF5 dataset importer
 
         """
-        if mapping is None:
-            mapping = {}
         importer = entities.data.HDF5DataImporter()
         importer.source = dataset.filename
         importer.item = dataset.name
-        for key, value in mapping.items():
-            # Note: datasets in array group have no column name(s)
-            if dataset.dtype.names:
-                importer.mapping[dataset.dtype.names[key]] = value
-            else:
-                importer.mapping[key] = value
+        if not mapping:
+            return importer
+        names = dataset.dtype.names
+        # Note: datasets in array group have no column name(s)
+        if names:
+            importer.mapping = {
+                names[key]: value for key, value in mapping.items()
+            }
+        else:
+            importer.mapping = dict(mapping)
         return importer
 
     @staticmethod
@@ -496,7 +534,7 @@ class VersionMapper:
             Name of the HDF5 dataset
 
         """
-        return dataset.name.rsplit("/", maxsplit=1)[1]
+        return dataset.name.rpartition("/")[2]
 
     @staticmethod
     def set_basic_metadata(hdf5_item=None, dataset=None):
@@ -515,18 +553,19 @@ class VersionMapper:
             Data object the metadata should be set for
 
         """
-        dataset.metadata.id = hdf5_item.name.split("/")[-1]  # noqa
-        dataset.metadata.name = hdf5_item.attributes["Name"]
-        dataset.metadata.access_mode, dataset.metadata.pv = (  # noqa
-            hdf5_item.attributes
-        )["Access"].split(":", maxsplit=1)
-        if "Unit" in hdf5_item.attributes:
-            dataset.metadata.unit = hdf5_item.attributes["Unit"]
+        attributes = hdf5_item.attributes
+        dataset.metadata.id = hdf5_item.name.rpartition("/")[2]  # noqa
+        dataset.metadata.name = attributes["Name"]
+        access_mode, _, pv = attributes["Access"].partition(":")
+        dataset.metadata.access_mode = access_mode  # noqa
+        dataset.metadata.pv = pv  # noqa
+        if "Unit" in attributes:
+            dataset.metadata.unit = attributes["Unit"]
 
     def _check_prerequisites(self):
-        if not self.source:
+        if self.source is None:
             raise ValueError("Missing source to map from.")
-        if not self.destination:
+        if self.destination is None:
             raise ValueError("Missing destination to map to.")
 
     def _set_dataset_names(self):
@@ -535,8 +574,8 @@ class VersionMapper:
     def _map(self):
         self._map_file_metadata()
         # Note: The sequence of method calls can be crucial, as the mapper
-        #       contains a list of datasets still to be mapped, and each
-        #       mapped dataset is removed from this list.
+        #       contains a set of datasets still to be mapped, and each
+        #       mapped dataset is removed from this set.
         self._map_timestamp_dataset()
         self._map_monitor_datasets()
         self._map_array_datasets()
@@ -551,35 +590,27 @@ class VersionMapper:
         pass
 
     def _map_monitor_datasets(self):
-        for name in self.datasets2map_in_monitor:
+        for name in sorted(self.datasets2map_in_monitor):
             monitor = getattr(self._monitor_group, name)
             dataset = entities.data.MonitorData()
-            importer_mapping = {
-                0: "milliseconds",
-                1: "data",
-            }
             importer = self.get_hdf5_dataset_importer(
-                dataset=monitor, mapping=importer_mapping
+                dataset=monitor, mapping=_MONITOR_MAPPING
             )
             dataset.importer.append(importer)
             self.set_basic_metadata(hdf5_item=monitor, dataset=dataset)
-            self.destination.monitors[self.get_dataset_name(monitor)] = (
-                dataset
-            )
+            self.destination.monitors[name] = dataset
 
     def _map_array_datasets(self):
         mapped_datasets = []
-        for name in self.datasets2map_in_main:
+        for name in sorted(self.datasets2map_in_main):
             item = getattr(self._main_group, name)
             # noinspection PyUnresolvedReferences
             if isinstance(item, Iterable) and "DeviceType" in item.attributes:
                 # noinspection PyTypeChecker
                 # TODO: Distinguish between MCA and other array detectors
                 self._map_mca_dataset(hdf5_group=item)
-                # noinspection PyTypeChecker
-                mapped_datasets.append(self.get_dataset_name(item))
-        for item in mapped_datasets:
-            self.datasets2map_in_main.remove(item)
+                mapped_datasets.append(name)
+        self.datasets2map_in_main.difference_update(mapped_datasets)
 
     def _map_array_dataset(self, hdf5_group=None):
         pass
@@ -589,23 +620,18 @@ class VersionMapper:
 
     def _map_axis_datasets(self):
         mapped_datasets = []
-        for name in self.datasets2map_in_main:
+        for name in sorted(self.datasets2map_in_main):
             item = getattr(self._main_group, name)
             if item.attributes["DeviceType"] == "Axis":
                 self._map_axis_dataset(hdf5_dataset=item)
-                mapped_datasets.append(self.get_dataset_name(item))
-        for item in mapped_datasets:
-            self.datasets2map_in_main.remove(item)
+                mapped_datasets.append(name)
+        self.datasets2map_in_main.difference_update(mapped_datasets)
 
     def _map_axis_dataset(self, hdf5_dataset=None, section="data"):
         # TODO: Check whether axis has an encoder (how? mapping?)
         dataset = entities.data.AxisData()
-        importer_mapping = {
-            0: "position_counts",
-            1: "data",
-        }
         importer = self.get_hdf5_dataset_importer(
-            dataset=hdf5_dataset, mapping=importer_mapping
+            dataset=hdf5_dataset, mapping=_POSITIONS_MAPPING
         )
         dataset.importer.append(importer)
         self.set_basic_metadata(hdf5_item=hdf5_dataset, dataset=dataset)
@@ -623,25 +649,21 @@ class VersionMapper:
 
     def _map_snapshot_datasets(self):
         mapped_datasets = []
-        for name in self.datasets2map_in_snapshot:
+        for name in sorted(self.datasets2map_in_snapshot):
             item = getattr(self._snapshot_group, name)
-            if item.attributes["DeviceType"] == "Axis":
+            device_type = item.attributes["DeviceType"]
+            if device_type == "Axis":
                 self._map_axis_dataset(hdf5_dataset=item, section="snapshots")
-                mapped_datasets.append(self.get_dataset_name(item))
-            elif item.attributes["DeviceType"] == "Channel":
+                mapped_datasets.append(name)
+            elif device_type == "Channel":
                 self._map_channel_snapshot_dataset(hdf5_dataset=item)
-                mapped_datasets.append(self.get_dataset_name(item))
-        for item in mapped_datasets:
-            self.datasets2map_in_snapshot.remove(item)
+                mapped_datasets.append(name)
+        self.datasets2map_in_snapshot.difference_update(mapped_datasets)
 
     def _map_channel_snapshot_dataset(self, hdf5_dataset=None):
         dataset = entities.data.ChannelData()
-        importer_mapping = {
-            0: "position_counts",
-            1: "data",
-        }
         importer = self.get_hdf5_dataset_importer(
-            dataset=hdf5_dataset, mapping=importer_mapping
+            dataset=hdf5_dataset, mapping=_POSITIONS_MAPPING
         )
         dataset.importer.append(importer)
         self.set_basic_metadata(hdf5_item=hdf5_dataset, dataset=dataset)
@@ -713,73 +735,50 @@ class VersionMapperV5(VersionMapper):
         # TODO: Move up to VersionMapperV4
         if hasattr(self.source.c1, "main"):
             self._main_group = self.source.c1.main
-            self.datasets2map_in_main = [
-                self.get_dataset_name(item)
-                for item in self.source.c1.main
-                if self.get_dataset_name(item)
-                not in ["normalized", "averagemeta", "standarddev"]
-            ]
+            self.datasets2map_in_main = {
+                self.get_dataset_name(item) for item in self._main_group
+            }.difference(_GROUPS_IN_MAIN)
         if hasattr(self.source.c1, "snapshot"):
             self._snapshot_group = self.source.c1.snapshot
-            self.datasets2map_in_snapshot = [
-                self.get_dataset_name(item)
-                for item in self.source.c1.snapshot
-            ]
+            self.datasets2map_in_snapshot = {
+                self.get_dataset_name(item) for item in self._snapshot_group
+            }
         if hasattr(self.source, "device"):
             self._monitor_group = self.source.device
-            self.datasets2map_in_monitor = [
+            self.datasets2map_in_monitor = {
                 self.get_dataset_name(item) for item in self._monitor_group
-            ]
+            }
 
     def _map(self):
         super()._map()
         self._map_log_messages()
 
     def _map_file_metadata(self):
-        root_mappings = {
-            "eveh5_version": "EVEH5Version",
-            "eve_version": "Version",
-            "xml_version": "XMLversion",
-            "measurement_station": "Location",
-            "description": "Comment",
-        }
-        for key, value in root_mappings.items():
-            if value in self.source.attributes:
-                setattr(
-                    self.destination.metadata,
-                    key,
-                    self.source.attributes[value],
-                )
-        c1_mappings = {
-            "preferred_axis": "preferredAxis",
-            "preferred_channel": "preferredChannel",
-            "preferred_normalisation_channel": "preferredNormalizationChannel",
-        }
-        for key, value in c1_mappings.items():
-            if value in self.source.c1.attributes:
-                setattr(
-                    self.destination.metadata,
-                    key,
-                    self.source.c1.attributes[value],
-                )
-        if "StartTimeISO" not in self.source.attributes:
-            self.destination.metadata.start = datetime.datetime.strptime(
-                f"{self.source.attributes['StartDate']} "
-                f"{self.source.attributes['StartTime']}",
+        metadata = self.destination.metadata
+        root_attributes = self.source.attributes
+        for key, value in _ROOT_METADATA_MAPPING:
+            attribute = root_attributes.get(value)
+            if attribute is not None:
+                setattr(metadata, key, attribute)
+        c1_attributes = self.source.c1.attributes
+        for key, value in _C1_METADATA_MAPPING:
+            attribute = c1_attributes.get(value)
+            if attribute is not None:
+                setattr(metadata, key, attribute)
+        if "StartTimeISO" not in root_attributes:
+            metadata.start = datetime.datetime.strptime(
+                f"{root_attributes['StartDate']} "
+                f"{root_attributes['StartTime']}",
                 "%d.%m.%Y %H:%M:%S",
             )
-            self.destination.metadata.end = datetime.datetime(1970, 1, 1)
+            metadata.end = datetime.datetime(1970, 1, 1)
 
     def _map_timestamp_dataset(self):
         # TODO: Move up to VersionMapperV2 (at least the earliest one)
         timestampdata = self.source.c1.meta.PosCountTimer
         dataset = entities.data.TimestampData()
-        importer_mapping = {
-            0: "position_counts",
-            1: "data",
-        }
         importer = self.get_hdf5_dataset_importer(
-            dataset=timestampdata, mapping=importer_mapping
+            dataset=timestampdata, mapping=_POSITIONS_MAPPING
         )
         dataset.importer.append(importer)
         dataset.metadata.unit = timestampdata.attributes["Unit"]
@@ -802,11 +801,8 @@ class VersionMapperV5(VersionMapper):
         # Create and add importers for each individual array
         importer_list = []
         for position in hdf5_group:
-            importer_mapping = {
-                0: "data",
-            }
             importer = self.get_hdf5_dataset_importer(
-                dataset=position, mapping=importer_mapping
+                dataset=position, mapping=_ARRAY_MAPPING
             )
             importer_list.append(importer)
         for idx in sorter:
@@ -814,58 +810,48 @@ class VersionMapperV5(VersionMapper):
 
     def _mca_dataset_set_options_in_main(self, dataset=None):
         # Handle options in main section
-        pv_base = dataset.metadata.pv.split(".")[0]
+        pv_base = dataset.metadata.pv.partition(".")[0]
         options_in_main = [
             item
             for item in self.datasets2map_in_main
             if item.startswith(f"{pv_base}.")
         ]
         options_in_main.sort()
+        main = self.source.c1.main
         for option in options_in_main:
-            mapping_table = {
-                "ELTM": "life_time",
-                "ERTM": "real_time",
-            }
-            attribute = option.split(".")[-1]
-            if attribute in mapping_table:
-                importer_mapping = {1: mapping_table[attribute]}
+            attribute = option.rpartition(".")[2]
+            hdf5_item = getattr(main, option)
+            if attribute in _MCA_OPTION_MAPPINGS:
                 importer = self.get_hdf5_dataset_importer(
-                    dataset=getattr(self.source.c1.main, option),
-                    mapping=importer_mapping,
+                    dataset=hdf5_item,
+                    mapping=_MCA_OPTION_MAPPINGS[attribute],
                 )
                 dataset.importer.append(importer)
                 self.datasets2map_in_main.remove(option)
             if attribute.startswith("R"):
                 roi = entities.data.MCAChannelROIData()
-                importer_mapping = {
-                    0: "position_counts",
-                    1: "data",
-                }
                 importer = self.get_hdf5_dataset_importer(
-                    dataset=getattr(self.source.c1.main, option),
-                    mapping=importer_mapping,
+                    dataset=hdf5_item,
+                    mapping=_POSITIONS_MAPPING,
                 )
                 roi.importer.append(importer)
-                self.set_basic_metadata(
-                    hdf5_item=getattr(self.source.c1.main, option),
-                    dataset=roi,
-                )
+                self.set_basic_metadata(hdf5_item=hdf5_item, dataset=roi)
                 dataset.roi.append(roi)
                 self.datasets2map_in_main.remove(option)
 
     def _mca_dataset_set_options_in_snapshot(self, dataset):
         # Handle options in snapshot section
-        pv_base = dataset.metadata.pv.split(".")[0]
+        pv_base = dataset.metadata.pv.partition(".")[0]
         options_in_snapshot = [
             item
             for item in self.datasets2map_in_snapshot
             if item.startswith(f"{pv_base}.")
         ]
         options_in_snapshot.sort()
+        snapshot = self.source.c1.snapshot
+        options = [item.rpartition(".")[2] for item in options_in_snapshot]
         calibration_options = [
-            item.split(".")[-1]
-            for item in options_in_snapshot
-            if item.split(".")[-1].startswith("CAL")
+            option for option in options if option.startswith("CAL")
         ]
         if calibration_options:
             mapping_table = {
@@ -879,7 +865,7 @@ class VersionMapperV5(VersionMapper):
                 # point taken from each, as calibration cannot sensibly
                 # change between scan modules of a scan.
                 name = ".".join([pv_base, option])
-                hdf5_dataset = getattr(self.source.c1.snapshot, name)
+                hdf5_dataset = getattr(snapshot, name)
                 hdf5_dataset.get_data()
                 setattr(
                     calibration,
@@ -889,11 +875,7 @@ class VersionMapperV5(VersionMapper):
                 options_in_snapshot.remove(name)
                 self.datasets2map_in_snapshot.remove(name)
             dataset.metadata.calibration = calibration
-        roi_options = [
-            item.split(".")[-1]
-            for item in options_in_snapshot
-            if item.split(".")[-1].startswith("R")
-        ]
+        roi_options = [option for option in options if option.startswith("R")]
         if roi_options:
             n_rois = len(set(int(item[1:-2]) for item in roi_options))
             for idx in range(n_rois):
@@ -903,15 +885,15 @@ class VersionMapperV5(VersionMapper):
                 else:
                     roi = dataset.roi[idx]
                 name = ".".join([pv_base, f"R{idx}LO"])
-                hdf5_dataset = getattr(self.source.c1.snapshot, name)
+                hdf5_dataset = getattr(snapshot, name)
                 hdf5_dataset.get_data()
                 roi.marker[0] = hdf5_dataset.data[name][0]
                 name = ".".join([pv_base, f"R{idx}HI"])
-                hdf5_dataset = getattr(self.source.c1.snapshot, name)
+                hdf5_dataset = getattr(snapshot, name)
                 hdf5_dataset.get_data()
                 roi.marker[1] = hdf5_dataset.data[name][0]
                 name = ".".join([pv_base, f"R{idx}NM"])
-                hdf5_dataset = getattr(self.source.c1.snapshot, name)
+                hdf5_dataset = getattr(snapshot, name)
                 hdf5_dataset.get_data()
                 roi.label = hdf5_dataset.data[name][0].decode()
             for option in roi_options:
@@ -924,7 +906,7 @@ class VersionMapperV5(VersionMapper):
         }
         for option, attribute in mapping_table.items():
             name = ".".join([pv_base, option])
-            hdf5_dataset = getattr(self.source.c1.snapshot, name)
+            hdf5_dataset = getattr(snapshot, name)
             hdf5_dataset.get_data()
             setattr(
                 dataset.metadata,
@@ -934,17 +916,21 @@ class VersionMapperV5(VersionMapper):
             options_in_snapshot.remove(name)
             self.datasets2map_in_snapshot.remove(name)
         for option in options_in_snapshot:
-            logger.warning("Option %s unmapped", option.split(".")[-1])
+            logger.warning("Option %s unmapped", option.rpartition(".")[2])
             self.datasets2map_in_snapshot.remove(option)
 
     def _map_log_messages(self):
         if not hasattr(self.source, "LiveComment"):
             return
         self.source.LiveComment.get_data()
-        for message in self.source.LiveComment.data:
-            log_message = entities.file.LogMessage()
-            log_message.from_string(message.decode())
-            self.destination.log_messages.append(log_message)
+        # Decode all messages at once rather than each message separately
+        messages = np.char.decode(
+            self.source.LiveComment.data.astype(bytes, copy=False)
+        )
+        self.destination.log_messages.extend(
+            entities.file.LogMessage().from_string(message)
+            for message in messages.tolist()
+        )
 
     def _map_0d_datasets(self):
         """
@@ -961,251 +947,189 @@ class VersionMapperV5(VersionMapper):
         in this particular case, ``normalizing_data`` are *not* mapped.
 
         """
-        datasets = list(self.datasets2map_in_main)
-        interval_datasets = [
+        main = self._main_group
+        averagemeta = getattr(main, "averagemeta", None)
+        normalized = getattr(main, "normalized", None)
+        datasets = set(self.datasets2map_in_main)
+        interval_datasets = {
             item
             for item in datasets
-            if getattr(self.source.c1.main, item).attributes["Detectortype"]
-            == "Interval"
-        ]
-        for hdf5_name in interval_datasets:
+            if getattr(main, item).attributes["Detectortype"] == "Interval"
+        }
+        for hdf5_name in sorted(interval_datasets):
             self._map_interval_dataset(hdf5_name=hdf5_name, normalized=False)
-            datasets.remove(hdf5_name)
-        average_datasets = []
-        if hasattr(self.source.c1, "main") and hasattr(
-            self.source.c1.main, "averagemeta"
-        ):
-            average_datasets = {
-                item.name.split("__")[0].split("/")[-1]
-                for item in self.source.c1.main.averagemeta
-                if item.name.count("__") == 1
-            }
-        for hdf5_name in average_datasets:
+        datasets.difference_update(interval_datasets)
+        averagemeta_names = []
+        if averagemeta is not None:
+            averagemeta_names = [
+                self.get_dataset_name(item) for item in averagemeta
+            ]
+        average_datasets = {
+            name.partition("__")[0]
+            for name in averagemeta_names
+            if name.count("__") == 1
+        }
+        for hdf5_name in sorted(average_datasets):
             self._map_average_dataset(hdf5_name=hdf5_name, normalized=False)
-            datasets.remove(hdf5_name)
-        normalized_datasets = []
-        if hasattr(self.source.c1, "main") and hasattr(
-            self.source.c1.main, "normalized"
-        ):
+        datasets.difference_update(average_datasets)
+        normalized_names = {}
+        if normalized is not None:
             normalized_datasets = [
-                self.get_dataset_name(item)
-                for item in self.source.c1.main.normalized
+                self.get_dataset_name(item) for item in normalized
             ]
-            normalized_interval_datasets = [
-                self.get_dataset_name(item)
-                for item in self.source.c1.main.normalized
-                if getattr(
-                    self.source.c1.main.normalized,
-                    self.get_dataset_name(item),
-                ).attributes["Detectortype"]
+            normalized_interval_datasets = {
+                name
+                for name in normalized_datasets
+                if getattr(normalized, name).attributes["Detectortype"]
                 == "Interval"
-            ]
-            for hdf5_name in normalized_interval_datasets:
-                normalized_datasets.remove(hdf5_name)
-                self._map_interval_dataset(
-                    hdf5_name=hdf5_name, normalized=True
-                )
-            if hasattr(self.source.c1.main, "averagemeta"):
-                average_datasets = {
-                    item.name.split("__")[0].split("/")[-1]
-                    for item in self.source.c1.main.averagemeta
-                }
-            normalized_average_datasets = [
-                self.get_dataset_name(item)
-                for item in self.source.c1.main.normalized
-                if self.get_dataset_name(item).split("__")[0]
-                in average_datasets
-            ]
-            for hdf5_name in normalized_average_datasets:
-                normalized_datasets.remove(hdf5_name)
-                datasets.remove(hdf5_name.split("__")[0])
-                self._map_average_dataset(
-                    hdf5_name=hdf5_name, normalized=True
-                )
-        for hdf5_name in datasets:
-            self._map_singlepoint_dataset(hdf5_name, normalized_datasets)
+            }
+            average_datasets = {
+                name.partition("__")[0] for name in averagemeta_names
+            }
+            normalized_average_datasets = {
+                name
+                for name in normalized_datasets
+                if name.partition("__")[0] in average_datasets
+            }
+            for hdf5_name in normalized_datasets:
+                if hdf5_name in normalized_interval_datasets:
+                    self._map_interval_dataset(
+                        hdf5_name=hdf5_name, normalized=True
+                    )
+            for hdf5_name in normalized_datasets:
+                if hdf5_name in normalized_average_datasets:
+                    datasets.discard(hdf5_name.partition("__")[0])
+                    self._map_average_dataset(
+                        hdf5_name=hdf5_name, normalized=True
+                    )
+            # Index normalized datasets by the name of their channel,
+            # keeping the first one in case there are several
+            for name in reversed(normalized_datasets):
+                if (
+                    name not in normalized_interval_datasets
+                    and name not in normalized_average_datasets
+                ):
+                    normalized_names[name.partition("__")[0]] = name
+        for hdf5_name in sorted(datasets):
+            self._map_singlepoint_dataset(
+                hdf5_name, normalized_names.get(hdf5_name)
+            )
 
-    def _map_singlepoint_dataset(
-        self, hdf5_name=None, normalized_datasets=None
-    ):
-        importer_mapping = {
-            0: "position_counts",
-            1: "data",
-        }
+    def _map_singlepoint_dataset(self, hdf5_name=None, normalized_name=None):
+        main = self.source.c1.main
+        hdf5_item = getattr(main, hdf5_name)
         importer = self.get_hdf5_dataset_importer(
-            dataset=getattr(self.source.c1.main, hdf5_name),
-            mapping=importer_mapping,
+            dataset=hdf5_item,
+            mapping=_POSITIONS_MAPPING,
         )
-        normalize_data = [
-            item
-            for item in normalized_datasets
-            if item.startswith(f"{hdf5_name}__")
-        ]
-        if normalize_data:
+        if normalized_name:
             dataset = entities.data.SinglePointNormalizedChannelData()
             dataset.importer.append(importer)
-            importer_mapping = {
-                1: "normalized_data",
-            }
             importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(
-                    self.source.c1.main.normalized, normalize_data[0]
-                ),
-                mapping=importer_mapping,
+                dataset=getattr(main.normalized, normalized_name),
+                mapping=_NORMALIZED_MAPPING,
             )
             dataset.importer.append(importer)
-            importer_mapping = {
-                1: "normalizing_data",
-            }
-            normalizing_data = normalize_data[0].split("__")[1]
+            normalizing_data = normalized_name.partition("__")[2]
             importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(self.source.c1.main, normalizing_data),
-                mapping=importer_mapping,
+                dataset=getattr(main, normalizing_data),
+                mapping=_NORMALIZING_MAPPING,
             )
             dataset.importer.append(importer)
             dataset.metadata.normalize_id = normalizing_data
         else:
             dataset = entities.data.SinglePointChannelData()
             dataset.importer.append(importer)
-        self.set_basic_metadata(
-            hdf5_item=getattr(self.source.c1.main, hdf5_name),
-            dataset=dataset,
-        )
+        self.set_basic_metadata(hdf5_item=hdf5_item, dataset=dataset)
         self.destination.data[hdf5_name] = dataset
         self.datasets2map_in_main.remove(hdf5_name)
 
     def _map_interval_dataset(self, hdf5_name=None, normalized=False):
-        importer_mapping = {
-            0: "position_counts",
-            1: "data",
-        }
+        main = self.source.c1.main
+        standarddev = main.standarddev
         if normalized:
-            importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(self.source.c1.main.normalized, hdf5_name),
-                mapping=importer_mapping,
-            )
+            hdf5_item = getattr(main.normalized, hdf5_name)
             dataset = entities.data.IntervalNormalizedChannelData()
         else:
-            importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(self.source.c1.main, hdf5_name),
-                mapping=importer_mapping,
-            )
+            hdf5_item = getattr(main, hdf5_name)
             dataset = entities.data.IntervalChannelData()
+        importer = self.get_hdf5_dataset_importer(
+            dataset=hdf5_item,
+            mapping=_POSITIONS_MAPPING,
+        )
         dataset.importer.append(importer)
-        importer_mapping = {
-            1: "counts",
-        }
         importer = self.get_hdf5_dataset_importer(
-            dataset=getattr(
-                self.source.c1.main.standarddev, f"{hdf5_name}__Count"
-            ),
-            mapping=importer_mapping,
+            dataset=getattr(standarddev, f"{hdf5_name}__Count"),
+            mapping=_COUNTS_MAPPING,
         )
         dataset.importer.append(importer)
-        importer_mapping = {
-            2: "std",
-        }
         trigger_interval_std = getattr(
-            self.source.c1.main.standarddev,
-            f"{hdf5_name}__TrigIntv-StdDev",
+            standarddev, f"{hdf5_name}__TrigIntv-StdDev"
         )
         importer = self.get_hdf5_dataset_importer(
             dataset=trigger_interval_std,
-            mapping=importer_mapping,
+            mapping=_STD_MAPPING,
         )
         dataset.importer.append(importer)
-        dataset.metadata.trigger_interval = trigger_interval_std.data[
-            "TriggerIntv"
-        ][0]
+        dataset.metadata.trigger_interval = (
+            trigger_interval_std.get_first_row()["TriggerIntv"]
+        )
         if normalized:
-            importer_mapping = {
-                1: "normalized_data",
-            }
             importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(
-                    self.source.c1.main.normalized, f"{hdf5_name}"
-                ),
-                mapping=importer_mapping,
+                dataset=hdf5_item,
+                mapping=_NORMALIZED_MAPPING,
             )
             dataset.importer.append(importer)
-            self.set_basic_metadata(
-                hdf5_item=getattr(self.source.c1.main.normalized, hdf5_name),
-                dataset=dataset,
-            )
         else:
-            self.set_basic_metadata(
-                hdf5_item=getattr(self.source.c1.main, hdf5_name),
-                dataset=dataset,
-            )
             self.datasets2map_in_main.remove(hdf5_name)
+        self.set_basic_metadata(hdf5_item=hdf5_item, dataset=dataset)
         self.destination.data[hdf5_name] = dataset
 
     def _map_average_dataset(self, hdf5_name=None, normalized=False):
         if normalized:
-            basename = hdf5_name.split("__")[0]
+            basename, _, normalizing_name = hdf5_name.partition("__")
             dataset = entities.data.AverageNormalizedChannelData()
         else:
             basename = hdf5_name
             dataset = entities.data.AverageChannelData()
-        importer_mapping = {
-            0: "position_counts",
-            1: "data",
-        }
+        main = self.source.c1.main
+        averagemeta = main.averagemeta
+        hdf5_item = getattr(main, basename)
         importer = self.get_hdf5_dataset_importer(
-            dataset=getattr(self.source.c1.main, basename),
-            mapping=importer_mapping,
+            dataset=hdf5_item,
+            mapping=_POSITIONS_MAPPING,
         )
         dataset.importer.append(importer)
-        if hasattr(self.source.c1.main.averagemeta, f"{hdf5_name}__Attempts"):
-            importer_mapping = {
-                1: "attempts",
-            }
+        attempts = getattr(averagemeta, f"{hdf5_name}__Attempts", None)
+        if attempts is not None:
             importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(
-                    self.source.c1.main.averagemeta, f"{hdf5_name}__Attempts"
-                ),
-                mapping=importer_mapping,
+                dataset=attempts,
+                mapping=_ATTEMPTS_MAPPING,
             )
             dataset.importer.append(importer)
-            dataset.metadata.max_attempts = getattr(
-                self.source.c1.main.averagemeta,
-                f"{hdf5_name}__Attempts",
-            ).data["MaxAttempts"][0]
-            dataset.metadata.low_limit = getattr(
-                self.source.c1.main.averagemeta,
-                f"{hdf5_name}__Limit-MaxDev",
-            ).data["Limit"][0]
-            dataset.metadata.max_deviation = getattr(
-                self.source.c1.main.averagemeta,
-                f"{hdf5_name}__Limit-MaxDev",
-            ).data["maxDeviation"][0]
+            dataset.metadata.max_attempts = attempts.get_first_row()[
+                "MaxAttempts"
+            ]
+            limits = getattr(
+                averagemeta, f"{hdf5_name}__Limit-MaxDev"
+            ).get_first_row()
+            dataset.metadata.low_limit = limits["Limit"]
+            dataset.metadata.max_deviation = limits["maxDeviation"]
         if normalized:
-            importer_mapping = {
-                1: "normalized_data",
-            }
             importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(self.source.c1.main.normalized, hdf5_name),
-                mapping=importer_mapping,
+                dataset=getattr(main.normalized, hdf5_name),
+                mapping=_NORMALIZED_MAPPING,
             )
             dataset.importer.append(importer)
-            importer_mapping = {
-                1: "normalizing_data",
-            }
             importer = self.get_hdf5_dataset_importer(
-                dataset=getattr(
-                    self.source.c1.main, hdf5_name.split("__")[1]
-                ),
-                mapping=importer_mapping,
+                dataset=getattr(main, normalizing_name),
+                mapping=_NORMALIZING_MAPPING,
             )
             dataset.importer.append(importer)
-        self.set_basic_metadata(
-            hdf5_item=getattr(self.source.c1.main, basename),
-            dataset=dataset,
-        )
+        self.set_basic_metadata(hdf5_item=hdf5_item, dataset=dataset)
         dataset.metadata.n_averages = getattr(
-            self.source.c1.main.averagemeta,
-            f"{hdf5_name}__AverageCount",
-        ).data["AverageCount"][0]
+            averagemeta, f"{hdf5_name}__AverageCount"
+        ).get_first_row()["AverageCount"]
         self.destination.data[basename] = dataset
         self.datasets2map_in_main.remove(basename)
         if hdf5_name in self.datasets2map_in_main:
@@ -1267,17 +1191,12 @@ class VersionMapperV6(VersionMapperV5):
 
     def _map_file_metadata(self):
         super()._map_file_metadata()
-        date_mappings = {
-            "start": "StartTimeISO",
-            "end": "EndTimeISO",
-        }
-        for key, value in date_mappings.items():
+        root_attributes = self.source.attributes
+        for key, value in _DATE_METADATA_MAPPING:
             setattr(
                 self.destination.metadata,
                 key,
-                datetime.datetime.fromisoformat(
-                    self.source.attributes[value]
-                ),
+                datetime.datetime.fromisoformat(root_attributes[value]),
             )
 
 
@@ -1328,5 +1247,14 @@ class VersionMapperV7(VersionMapperV6):
 
     def _map_file_metadata(self):
         super()._map_file_metadata()
-        if self.source.attributes["Simulation"] == "yes":
-            self.destination.metadata.simulation = True
+        self.destination.metadata.simulation = (
+            self.source.attributes["Simulation"] == "yes"
+        )
+
+
+# Mapper classes for the major versions of the eveH5 schema
+_VERSION_MAPPERS = {
+    "5": VersionMapperV5,
+    "6": VersionMapperV6,
+    "7": VersionMapperV7,
+}
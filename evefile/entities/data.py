@@ -207,6 +207,8 @@ Module documentation
 
 import copy
 import logging
+import threading
+from contextlib import contextmanager
 
 import h5py
 import numpy as np
@@ -218,6 +220,42 @@ from evefile.entities import metadata
 logger = logging.getLogger(__name__)
 
 
+def _forward_fill(values, positions, new_positions):
+    """
+    Map values onto new positions, taking the previous value present.
+
+    For each new position, the index of the last position not larger
+    than the new position is obtained by a single binary search over all
+    new positions. New positions preceding all positions have no previous
+    value and are masked.
+
+    Parameters
+    ----------
+    values : :class:`numpy.ndarray`
+        Values corresponding to the positions
+
+    positions : :class:`numpy.ndarray`
+        Sorted positions the values are recorded for
+
+    new_positions : :class:`numpy.ndarray`
+        Positions the values should be mapped to
+
+    Returns
+    -------
+    values : :class:`numpy.ndarray` | :class:`numpy.ma.MaskedArray`
+        Values mapped to the new positions.
+
+        Only if some new positions have no previous value, a masked array
+        is returned.
+
+    """
+    indices = np.searchsorted(positions, new_positions, side="right") - 1
+    missing = indices < 0
+    if missing.any():
+        return ma.masked_array(values[np.maximum(indices, 0)], mask=missing)
+    return values[indices]
+
+
 class Data:
     """
     Data recorded from the devices involved in a measurement.
@@ -345,8 +383,9 @@ class Data:
         image data stored mostly in separate files.
 
         """
-        for importer in self.importer:
-            self._import_from_hdf5dataimporter(importer=importer)
+        with HDF5DataImporter.keep_files_open():
+            for importer in self.importer:
+                self._import_from_hdf5dataimporter(importer=importer)
 
     def _import_from_hdf5dataimporter(self, importer=None):
         importer.load()
@@ -803,31 +842,65 @@ class MeasureData(Data):
         """
         if positions is None:
             raise ValueError("No positions provided")
+        # Indices are identical for all data attributes, hence compute once.
+        if len(positions) < len(self.position_counts):
+            indices = np.searchsorted(self.position_counts, positions).astype(
+                np.int64
+            )
+        elif len(positions) > len(self.position_counts):
+            indices = np.searchsorted(positions, self.position_counts).astype(
+                np.int64
+            )
+            # Only keep values whose positions are present in positions.
+            matches = (
+                positions[np.minimum(indices, len(positions) - 1)]
+                == self.position_counts
+            )
+            indices = indices[matches]
         for item in self._data_attributes:
             data_ = getattr(self, item)
             if len(positions) < len(self.position_counts):
                 # pylint: disable=unsubscriptable-object
-                data_ = data_[
-                    np.searchsorted(self.position_counts, positions).astype(
-                        np.int64
-                    )
-                ]
+                data_ = data_[indices]
             elif len(positions) > len(self.position_counts):
-                original_values = data_
-                data_ = ma.masked_array(np.zeros(len(positions)))
-                data_ = ma.masked_array(data_)
-                new_positions = np.setdiff1d(positions, self.position_counts)
-                data_[
-                    np.searchsorted(positions, self.position_counts).astype(
-                        np.int64
-                    )
-                ] = original_values
-                data_[
-                    np.searchsorted(positions, new_positions).astype(np.int64)
-                ] = ma.masked
+                data_ = self._masked_superset(
+                    np.asarray(data_)[matches], indices, len(positions)
+                )
             setattr(self, item, data_)
         self.position_counts = positions
 
+    @staticmethod
+    def _masked_superset(values, indices, length):
+        """
+        Spread values onto a larger array, masking all other entries.
+
+        The masked array is constructed only once with an explicit mask,
+        rather than masking the entries one by one afterwards.
+
+        Parameters
+        ----------
+        values : :class:`numpy.ndarray`
+            Values to spread
+
+        indices : :class:`numpy.ndarray`
+            Indices of the values in the resulting array
+
+        length : :class:`int`
+            Length of the resulting array
+
+        Returns
+        -------
+        values : :class:`numpy.ma.MaskedArray`
+            Values with all entries not set from the original values masked
+
+        """
+        values = np.asarray(values)
+        data_ = np.zeros((length, *values.shape[1:]), dtype=values.dtype)
+        data_[indices] = values
+        mask = np.ones(data_.shape, dtype=bool)
+        mask[indices] = False
+        return ma.masked_array(data_, mask=mask)
+
     def _import_from_hdf5dataimporter(self, importer=None):
         """
         Import data from HDF5 using data importer.
@@ -891,7 +964,8 @@ class DeviceData(MeasureData):
         If positions are not present in the original data, the previous
         value present is automatically taken for this position. This is a
         valid assumption, as the underlying EPICS monitors only record a
-        new value if the actual value has changed.
+        new value if the actual value has changed. Positions preceding
+        the first position present are masked.
 
         .. note::
 
@@ -913,11 +987,8 @@ class DeviceData(MeasureData):
         """
         if positions is None:
             raise ValueError("No positions provided")
-        new_positions = (
-            np.searchsorted(self.position_counts, positions, side="right") - 1
-        )
+        self.data = _forward_fill(self.data, self.position_counts, positions)
         self.position_counts = positions
-        self.data = self.data[new_positions]
 
 
 class AxisData(MeasureData):
@@ -1060,15 +1131,10 @@ class AxisData(MeasureData):
                     insert_positions,
                     snapshot.position_counts,
                 )
-            new_positions = (
-                np.searchsorted(self.position_counts, positions, side="right")
-                - 1
+            self.data = _forward_fill(
+                self.data, self.position_counts, positions
             )
             self.position_counts = positions
-            self.data = self.data[new_positions]
-            if np.where(new_positions < 0)[0].size:
-                self.data = ma.masked_array(self.data)
-                self.data[np.where(new_positions < 0)] = ma.masked
 
 
 class ChannelData(MeasureData):
@@ -1194,10 +1260,9 @@ class TimestampData(MeasureData):
             Position(s) corresponding to the timestamp(s) given.
 
         """
-        time = np.asarray(time)
-        time = np.where(time < 0, self.data[0], time)
-        idx = np.digitize(time, self.data)
-        return self.position_counts[idx - 1]
+        # Times before the first timestamp (e.g., -1) map to first position
+        idx = np.searchsorted(self.data, time, side="right") - 1
+        return self.position_counts[np.maximum(idx, 0)]
 
 
 class SinglePointChannelData(ChannelData):
@@ -2338,14 +2403,50 @@ class HDF5DataImporter(DataImporter):
         importer = HDF5DataImporter(source="test.h5", item="/c1/main/test")
         data = importer.load()
 
+    Opening the HDF5 file for each dataset loaded is a massive overhead
+    when loading many datasets at once. Hence, within the
+    :meth:`keep_files_open` context, all importers (of the current
+    thread) share their open files:
+
+    .. code-block::
+
+        with HDF5DataImporter.keep_files_open():
+            for importer in importers:
+                importer.load()
+
     """
 
+    _open_files = threading.local()
+
     def __init__(self, source=""):
         super().__init__(source=source)
         self.item = ""
         self.mapping = {}
         self.data = None
 
+    @classmethod
+    @contextmanager
+    def keep_files_open(cls):
+        """
+        Context manager sharing open HDF5 files between importers.
+
+        Within the context, each HDF5 file is opened only once by the
+        first importer loading data from it, and closed upon leaving the
+        context. Contexts can be nested, and only the outermost context
+        closes the files. Files are shared per thread only.
+
+        """
+        if getattr(HDF5DataImporter._open_files, "files", None) is not None:
+            yield
+            return
+        HDF5DataImporter._open_files.files = {}
+        try:
+            yield
+        finally:
+            for file in HDF5DataImporter._open_files.files.values():
+                file.close()
+            HDF5DataImporter._open_files.files = None
+
     def load(self, source="", item=""):
         """
         Load data from source.
@@ -2393,6 +2494,12 @@ class HDF5DataImporter(DataImporter):
         return self.data
 
     def _load(self):
-        with h5py.File(self.source, "r") as file:
-            self.data = file[self.item][...]
+        open_files = getattr(HDF5DataImporter._open_files, "files", None)
+        if open_files is None:
+            with h5py.File(self.source, "r") as file:
+                self.data = file[self.item][...]
+            return self.data
+        if self.source not in open_files:
+            open_files[self.source] = h5py.File(self.source, "r")
+        self.data = open_files[self.source][self.item][...]
         return self.data
@@ -302,10 +302,16 @@ class LogMessage:
         string : :class:`str`
             Log message consisting of timestamp and actual message.
 
+        Returns
+        -------
+        log_message : :class:`LogMessage`
+            The log message itself, for convenience.
+
         """
         timestamp, message = string.split(": ", maxsplit=1)
         self.timestamp = datetime.datetime.fromisoformat(timestamp)
         self.message = message
+        return self
 
     def __str__(self):
         """
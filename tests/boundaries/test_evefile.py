@@ -347,6 +347,28 @@ class TestEveFile(unittest.TestCase):
         for item in result:
             self.assertIsInstance(item, evefile.entities.data.MeasureData)
 
+    def test_get_joined_data_with_array_of_names(self):
+        h5file = DummyHDF5File(filename=self.filename)
+        h5file.create()
+        self.evefile = evefile.EveFile(filename=self.filename)
+        names = np.asarray(
+            [item.metadata.name for item in self.evefile.data.values()]
+        )
+        result = self.evefile.get_joined_data(data=names)
+        self.assertEqual(len(names), len(result))
+        for item in result:
+            self.assertIsInstance(item, evefile.entities.data.MeasureData)
+
+    def test_get_joined_data_with_generator_of_names(self):
+        h5file = DummyHDF5File(filename=self.filename)
+        h5file.create()
+        self.evefile = evefile.EveFile(filename=self.filename)
+        names = [item.metadata.name for item in self.evefile.data.values()]
+        result = self.evefile.get_joined_data(data=(name for name in names))
+        self.assertEqual(len(names), len(result))
+        for item in result:
+            self.assertIsInstance(item, evefile.entities.data.MeasureData)
+
     def test_get_joined_data_with_monitor_ids(self):
         h5file = DummyHDF5File(filename=self.filename)
         h5file.create()
@@ -465,6 +487,19 @@ class TestEveFile(unittest.TestCase):
             [self.evefile.data[data_name].metadata.name],
         )
 
+    def test_dataframe_with_generator_of_ids(self):
+        h5file = DummyHDF5File(filename=self.filename)
+        h5file.create()
+        self.evefile = evefile.EveFile(filename=self.filename)
+        data_name = "SimMot:01"
+        dataframe = self.evefile.get_dataframe(
+            data=(name for name in [data_name])
+        )
+        self.assertListEqual(
+            list(dataframe.columns),
+            [self.evefile.data[data_name].metadata.name],
+        )
+
     def test_dataframe_contains_index_name(self):
         h5file = DummyHDF5File(filename=self.filename)
         h5file.create()
@@ -199,6 +199,31 @@ class TestHDF5Dataset(unittest.TestCase):
         self.hdf5_dataset.name = "/c1/main/test"
         self.assertTupleEqual((0,), self.hdf5_dataset._data.shape)
 
+    def test_get_first_row_without_filename_raises(self):
+        with self.assertRaisesRegex(ValueError, "Missing attribute filename"):
+            self.hdf5_dataset.get_first_row()
+
+    def test_get_first_row_returns_first_row(self):
+        DummyHDF5File(filename=self.filename).create()
+        self.hdf5_dataset.filename = self.filename
+        self.hdf5_dataset.name = "/c1/main/test"
+        with h5py.File(self.filename, "r") as file:
+            first_row = file["/c1/main/test"][0]
+        np.testing.assert_array_equal(
+            first_row, self.hdf5_dataset.get_first_row()
+        )
+
+    def test_get_first_row_does_not_load_data(self):
+        DummyHDF5File(filename=self.filename).create()
+        self.hdf5_dataset.filename = self.filename
+        self.hdf5_dataset.name = "/c1/main/test"
+        self.hdf5_dataset.get_first_row()
+        self.assertTupleEqual((0,), self.hdf5_dataset._data.shape)
+
+    def test_get_first_row_uses_existing_data(self):
+        self.hdf5_dataset.data = np.asarray([42, 43])
+        self.assertEqual(42, self.hdf5_dataset.get_first_row())
+
 
 class TestHDF5Group(unittest.TestCase):
     def setUp(self):
@@ -383,6 +408,13 @@ class TestHDF5File(unittest.TestCase):
         self.hdf5_file.read(self.filename)
         self.assertTrue(self.hdf5_file.attributes)
 
+    def test_read_sets_dtype_of_datasets(self):
+        DummyHDF5File(filename=self.filename).create()
+        self.hdf5_file.read(self.filename)
+        # noinspection PyUnresolvedReferences
+        dataset = self.hdf5_file.c1.main.test
+        self.assertEqual(np.dtype("f8"), dataset._dtype)
+
     def test_read_closes_hdf5_file(self):
         DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.read_attributes = True
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 from numpy import ma
@@ -75,6 +76,119 @@ class MockEveFile:
         return self.data[names[name]]
 
 
+class TestPositionSetOperations(unittest.TestCase):
+    def test_union_returns_sorted_unique_positions(self):
+        arrays = [
+            np.asarray([5, 7, 9]),
+            np.asarray([1, 5, 6]),
+            np.asarray([2, 9]),
+        ]
+        np.testing.assert_array_equal(
+            [1, 2, 5, 6, 7, 9], joining._union(arrays)
+        )
+
+    def test_intersection_returns_common_positions(self):
+        arrays = [
+            np.asarray([1, 2, 3, 5, 7, 9]),
+            np.asarray([2, 5, 9]),
+            np.asarray([1, 2, 5, 6, 9]),
+        ]
+        np.testing.assert_array_equal(
+            [2, 5, 9], joining._intersection(arrays)
+        )
+
+    def test_union_with_sparse_positions_returns_sorted_unique(self):
+        arrays = [np.asarray([5, 100000]), np.asarray([1, 5, 2000])]
+        np.testing.assert_array_equal(
+            [1, 5, 2000, 100000], joining._union(arrays)
+        )
+
+    def test_union_with_large_sparse_positions_returns_sorted_unique(self):
+        arrays = [
+            np.asarray([5, 2**40], dtype=np.int64),
+            np.asarray([1, 5, 2**33], dtype=np.int64),
+        ]
+        np.testing.assert_array_equal(
+            [1, 5, 2**33, 2**40], joining._union(arrays)
+        )
+
+    def test_union_with_many_sparse_positions_returns_sorted_unique(self):
+        arrays = [
+            np.arange(0, 10**7, 1000),
+            np.arange(500, 10**7, 700),
+            np.arange(0, 10**7, 300),
+        ]
+        np.testing.assert_array_equal(
+            np.unique(np.concatenate(arrays)), joining._union(arrays)
+        )
+
+    def test_union_with_float_positions_returns_sorted_unique(self):
+        arrays = [np.asarray([1.0, 3.0]), np.asarray([2.0, 3.0])]
+        np.testing.assert_array_equal([1.0, 2.0, 3.0], joining._union(arrays))
+
+    def test_intersection_with_sparse_positions_returns_common(self):
+        arrays = [np.asarray([5, 2000, 100000]), np.asarray([1, 5, 100000])]
+        np.testing.assert_array_equal(
+            [5, 100000], joining._intersection(arrays)
+        )
+
+    def test_as_positions_returns_contiguous_int64_positions(self):
+        positions = np.arange(10, dtype=np.int32)[::2]
+        result = joining._as_positions(positions)
+        self.assertEqual(np.int64, result.dtype)
+        self.assertTrue(result.flags["C_CONTIGUOUS"])
+        np.testing.assert_array_equal(positions, result)
+
+    def test_as_positions_keeps_non_integer_positions(self):
+        positions = np.asarray([1.0, 2.0])
+        self.assertIs(positions, joining._as_positions(positions))
+
+    def test_set_operations_without_positions_return_empty_array(self):
+        for operation in (joining._union, joining._intersection):
+            with self.subTest(operation=operation.__name__):
+                result = operation([])
+                self.assertEqual(0, result.size)
+                self.assertEqual(np.int64, result.dtype)
+
+    def test_intersection_with_sparse_positions_of_similar_length(self):
+        rng = np.random.default_rng(42)
+        arrays = [np.unique(rng.integers(0, 10**9, 10**4)) for _ in range(3)]
+        common = np.unique(rng.integers(0, 10**9, 10**3))
+        arrays = [np.union1d(array, common) for array in arrays]
+        np.testing.assert_array_equal(common, joining._intersection(arrays))
+
+    def test_set_operations_with_empty_positions(self):
+        arrays = [np.asarray([]), np.asarray([1, 2, 3])]
+        np.testing.assert_array_equal([1, 2, 3], joining._union(arrays))
+        self.assertEqual(0, joining._intersection(arrays).size)
+
+    def test_intersection_with_disjoint_ranges_returns_empty(self):
+        arrays = [np.arange(0, 10), np.arange(20, 30), np.arange(5, 25)]
+        self.assertEqual(0, joining._intersection(arrays).size)
+
+    def test_intersection_with_overlapping_ranges_returns_common(self):
+        arrays = [np.arange(0, 10**6), np.asarray([5, 10**6 - 1, 10**7])]
+        np.testing.assert_array_equal(
+            [5, 10**6 - 1], joining._intersection(arrays)
+        )
+
+    def test_union_with_identical_positions_returns_positions(self):
+        positions = np.asarray([1, 5, 7])
+        result = joining._union([positions, positions.copy()])
+        np.testing.assert_array_equal(positions, result)
+        self.assertFalse(np.shares_memory(positions, result))
+
+    def test_intersection_with_single_array_returns_positions(self):
+        positions = np.asarray([1, 5, 7])
+        result = joining._intersection([positions])
+        np.testing.assert_array_equal(positions, result)
+        self.assertFalse(np.shares_memory(positions, result))
+
+    def test_intersection_without_common_positions_returns_empty(self):
+        arrays = [np.asarray([1, 2]), np.asarray([3, 4])]
+        self.assertEqual(0, len(joining._intersection(arrays)))
+
+
 class TestJoin(unittest.TestCase):
     def setUp(self):
         self.join = joining.Join()
@@ -96,6 +210,23 @@ class TestJoin(unittest.TestCase):
         join = joining.Join(file=file)
         self.assertEqual(file, join.file)
 
+    def test_join_with_snapshot_cache_merges_snapshots_only_once(self):
+        file = MockEveFile(snapshots=True)
+        file.data["SimMot:01"].position_counts = np.arange(
+            2, 7, dtype=np.int32
+        )
+        file.set_ids()
+        snapshot_cache = {}
+        with mock.patch.object(
+            joining.np, "insert", wraps=np.insert
+        ) as insert:
+            for _ in range(2):
+                join = joining.ChannelPositions(
+                    file=file, snapshot_cache=snapshot_cache
+                )
+                join.join(file.data.values())
+        self.assertEqual(2, insert.call_count)
+
     def test_join_without_evefile_raises(self):
         self.join.file = None
         with self.assertRaisesRegex(
@@ -108,6 +239,31 @@ class TestJoin(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Need data to join data."):
             self.join.join()
 
+    def test_join_with_empty_generator_raises(self):
+        self.join.file = self.evefile
+        with self.assertRaisesRegex(ValueError, "Need data to join data."):
+            self.join.join(data=(item for item in []))
+
+    def test_join_with_generator(self):
+        class MyJoin(joining.Join):
+            def _join(self, data=None):
+                return data
+
+        self.join = MyJoin()
+        self.join.file = self.evefile
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(5), positions=np.linspace(0, 4, 5)
+            ),
+            "SimMot:01": MockAxis(
+                data=np.random.random(7), positions=np.linspace(0, 6, 7)
+            ),
+        }
+        result = self.join.join(
+            data=(item for item in self.join.file.data.values())
+        )
+        self.assertEqual(2, len(result))
+
     def test_join_returns_list(self):
         class MyJoin(joining.Join):
             def _join(self, data=None):
@@ -165,6 +321,88 @@ class TestChannelPositions(unittest.TestCase):
         self.assertIsNot(result[0], self.join.file.data["SimChan:01"])
         self.assertIsNot(result[1], self.join.file.data["SimMot:01"])
 
+    def test_join_does_not_alter_original_data(self):
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(5), positions=np.arange(0, 5)
+            ),
+            "SimMot:01": MockAxis(
+                data=np.random.random(3), positions=np.asarray([1, 2, 4])
+            ),
+        }
+        axis = self.join.file.data["SimMot:01"]
+        data_ = axis.data.copy()
+        self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal(data_, axis.data)
+        np.testing.assert_array_equal([1, 2, 4], axis.position_counts)
+
+    def test_join_with_axis_on_result_positions_returns_copy(self):
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(3), positions=np.asarray([1, 2, 4])
+            ),
+            "SimMot:01": MockAxis(
+                data=np.random.random(3), positions=np.asarray([1, 2, 4])
+            ),
+        }
+        axis = self.join.file.data["SimMot:01"]
+        data_ = axis.data.copy()
+        result = self.join.join(data=self.join.file.data.values())
+        result[1].data[0] = -1
+        np.testing.assert_array_equal(data_, axis.data)
+
+    def test_join_does_not_share_positions_with_original_data(self):
+        channel = self.join.file.data["SimChan:01"]
+        positions = channel.position_counts.copy()
+        result = self.join.join(data=self.join.file.data.values())
+        result[0].position_counts += 100
+        np.testing.assert_array_equal(positions, channel.position_counts)
+
+    def test_join_keeps_mask_of_axis_data(self):
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(4), positions=np.arange(1, 5)
+            ),
+            "SimMot:01": MockAxis(
+                data=np.ma.masked_array([1.0, 2.0, 3.0], mask=[1, 0, 0]),
+                positions=np.arange(1, 4),
+            ),
+        }
+        result = self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal(
+            [True, False, False, False], np.ma.getmaskarray(result[1].data)
+        )
+        np.testing.assert_array_equal(
+            [2.0, 3.0, 3.0], result[1].data.compressed()
+        )
+
+    def test_join_keeps_mask_of_axis_data_with_snapshot(self):
+        self.join.file = MockEveFile(snapshots=True)
+        self.join.file.data["SimChan:01"].position_counts = np.arange(1, 8)
+        self.join.file.data["SimChan:01"].data = np.random.random(7)
+        self.join.file.data["SimMot:01"].data = np.ma.masked_array(
+            np.random.random(5), mask=[0, 1, 0, 0, 0]
+        )
+        self.join.file.set_ids()
+        result = self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal(
+            [False, False, True, False, False, False, False],
+            np.ma.getmaskarray(result[1].data),
+        )
+
+    def test_repeated_joins_load_data_only_once(self):
+        channel = evefile.entities.data.ChannelData()
+
+        def load_data():
+            channel.position_counts = np.arange(2, 7)
+            channel.data = np.random.random(5)
+
+        channel.get_data = mock.MagicMock(side_effect=load_data)
+        self.join.file.data["SimChan:01"] = channel
+        self.join.join(data=self.join.file.data.values())
+        self.join.join(data=self.join.file.data.values())
+        channel.get_data.assert_called_once()
+
     def test_join_returns_data_in_input_order(self):
         result = self.join.join(
             data=[
@@ -274,6 +512,35 @@ class TestChannelPositions(unittest.TestCase):
         self.assertEqual(result[1].data[0], result[1].data[1])
         self.assertEqual(result[1].data[2], result[1].data[3])
 
+    def test_join_fills_values_of_multiple_axes(self):
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(5), positions=np.arange(0, 5)
+            ),
+            "SimMot:01": MockAxis(
+                data=np.random.random(3), positions=np.asarray([0, 2, 4])
+            ),
+            "SimMot:02": MockAxis(
+                data=np.random.random(3), positions=np.asarray([1, 2, 3])
+            ),
+            "SimMot:03": MockAxis(
+                data=np.asarray(["a", "b"]), positions=np.asarray([0, 3])
+            ),
+        }
+        result = self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal(
+            self.join.file.data["SimMot:01"].data[[0, 0, 1, 1, 2]],
+            result[1].data,
+        )
+        self.assertTrue(result[2].data.mask[0])
+        np.testing.assert_array_equal(
+            self.join.file.data["SimMot:02"].data[[0, 1, 2, 2]],
+            result[2].data[1:],
+        )
+        np.testing.assert_array_equal(
+            ["a", "a", "a", "b", "b"], result[3].data
+        )
+
     def test_join_fills_axes_values_with_snapshots(self):
         self.join.file.data = {
             "SimChan:01": MockChannel(
@@ -299,6 +566,30 @@ class TestChannelPositions(unittest.TestCase):
             result[1].data[0],
         )
 
+    def test_join_with_snapshot_filling_missing_positions(self):
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(5), positions=np.arange(1, 6)
+            ),
+            "SimMot:01": MockAxis(
+                data=np.asarray([2.0, 3.0, 4.0, 5.0]),
+                positions=np.arange(2, 6),
+            ),
+        }
+        self.join.file.snapshots = {
+            "SimMot:01": MockAxis(
+                data=np.asarray([1.0]), positions=np.asarray([1])
+            ),
+        }
+        self.join.file.set_ids()
+        result = self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal(
+            np.arange(1, 6), result[1].position_counts
+        )
+        np.testing.assert_array_equal(
+            [1.0, 2.0, 3.0, 4.0, 5.0], result[1].data
+        )
+
     def test_join_returns_values_for_union_of_all_channel_positions(self):
         self.join.file.data = {
             "SimMot:01": MockAxis(
@@ -347,6 +638,21 @@ class TestChannelPositions(unittest.TestCase):
             ),
         )
 
+    def test_join_with_many_channels(self):
+        self.join.file.data = {
+            f"SimChan:0{idx}": MockChannel(
+                data=np.random.random(3), positions=np.arange(idx, idx + 3)
+            )
+            for idx in range(5)
+        }
+        result = self.join.join(data=self.join.file.data.values())
+        for idx, item in enumerate(result):
+            np.testing.assert_array_equal(np.arange(7), item.position_counts)
+            np.testing.assert_array_equal(
+                self.join.file.data[f"SimChan:0{idx}"].data,
+                item.data[idx : idx + 3],
+            )
+
     def test_join_with_monitors(self):
         self.join.file.data = {
             "SimChan:01": MockChannel(
@@ -393,6 +699,15 @@ class TestAxisPositions(unittest.TestCase):
                 len(self.join.file.data["SimMot:01"].data), len(item.data)
             )
 
+    def test_join_without_axes_returns_empty_data(self):
+        self.join.file.data = {
+            "SimChan:01": MockChannel(
+                data=np.random.random(5), positions=np.linspace(0, 4, 5)
+            ),
+        }
+        result = self.join.join(data=self.join.file.data.values())
+        self.assertEqual(0, len(result[0].data))
+
     def test_join_returns_values_for_all_axis_positions(self):
         self.join.file.data = {
             "SimMot:01": MockAxis(
@@ -420,6 +735,27 @@ class TestAxisPositions(unittest.TestCase):
         result = self.join.join(data=self.join.file.data.values())
         self.assertEqual(len(result[0].data), len(result[1].data))
 
+    def test_join_with_snapshot_filling_missing_positions(self):
+        self.join.file.data = {
+            "SimMot:01": MockAxis(
+                data=np.asarray([1.0, 2.0, 3.0]), positions=np.arange(1, 4)
+            ),
+            "SimMot:02": MockAxis(
+                data=np.asarray([10.0, 30.0]), positions=np.asarray([1, 3])
+            ),
+        }
+        self.join.file.snapshots = {
+            "SimMot:02": MockAxis(
+                data=np.asarray([20.0]), positions=np.asarray([2])
+            ),
+        }
+        self.join.file.set_ids()
+        result = self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal(
+            np.arange(1, 4), result[1].position_counts
+        )
+        np.testing.assert_array_equal([10.0, 20.0, 30.0], result[1].data)
+
 
 class TestAxisAndChannelPositions(unittest.TestCase):
     def setUp(self):
@@ -480,6 +816,24 @@ class TestAxisOrChannelPositions(unittest.TestCase):
         for item in result:
             self.assertEqual(len(positions), len(item.data))
 
+    def test_join_with_snapshot_filling_missing_positions(self):
+        self.join.file.data = {
+            "SimMot:01": MockAxis(
+                data=np.asarray([1.0, 2.0, 3.0]), positions=np.arange(1, 4)
+            ),
+            "SimMot:02": MockAxis(
+                data=np.asarray([10.0, 30.0]), positions=np.asarray([1, 3])
+            ),
+        }
+        self.join.file.snapshots = {
+            "SimMot:02": MockAxis(
+                data=np.asarray([20.0]), positions=np.asarray([2])
+            ),
+        }
+        self.join.file.set_ids()
+        result = self.join.join(data=self.join.file.data.values())
+        np.testing.assert_array_equal([10.0, 20.0, 30.0], result[1].data)
+
 
 class TestJoinFactory(unittest.TestCase):
     def setUp(self):
@@ -497,6 +851,37 @@ class TestJoinFactory(unittest.TestCase):
             joining.Join,
         )
 
+    def test_joins_merge_snapshots_only_once(self):
+        self.factory.file = MockEveFile(snapshots=True)
+        self.factory.file.data["SimMot:01"].position_counts = np.arange(
+            2, 7, dtype=np.int32
+        )
+        self.factory.file.set_ids()
+        data = self.factory.file.data.values()
+        with mock.patch.object(
+            joining.np, "insert", wraps=np.insert
+        ) as insert:
+            self.factory.get_join(mode="ChannelPositions").join(data)
+            self.factory.get_join(mode="ChannelPositions").join(data)
+        self.assertEqual(2, insert.call_count)
+
+    def test_joins_with_snapshots_do_not_share_data(self):
+        # Snapshot fills exactly the positions missing for the axis
+        self.factory.file = MockEveFile(snapshots=True)
+        self.factory.file.data["SimChan:01"].position_counts = np.arange(1, 8)
+        self.factory.file.data["SimChan:01"].data = np.random.random(7)
+        self.factory.file.set_ids()
+        data = self.factory.file.data.values()
+        first = self.factory.get_join(mode="ChannelPositions").join(data)
+        values = first[1].data.copy()
+        first[1].data[0] = -1
+        second = self.factory.get_join(mode="ChannelPositions").join(data)
+        np.testing.assert_array_equal(values, second[1].data)
+
+    def test_get_join_with_unknown_mode_raises(self):
+        with self.assertRaisesRegex(ValueError, "Unknown join mode"):
+            self.factory.get_join(mode="JoinFactory")
+
     def test_initialise_with_evefile_sets_evefile(self):
         file = "foo"
         factory = joining.JoinFactory(file=file)
@@ -506,3 +891,15 @@ class TestJoinFactory(unittest.TestCase):
         self.factory.file = "foo"
         join = self.factory.get_join()
         self.assertEqual(self.factory.file, join.file)
+
+    def test_joins_with_snapshots_return_identical_results(self):
+        self.factory.file = MockEveFile(snapshots=True)
+        self.factory.file.set_ids()
+        data = self.factory.file.data.values()
+        first = self.factory.get_join(mode="ChannelPositions").join(data)
+        second = self.factory.get_join(mode="ChannelPositions").join(data)
+        for first_item, second_item in zip(first, second):
+            np.testing.assert_array_equal(first_item.data, second_item.data)
+            np.testing.assert_array_equal(
+                first_item.position_counts, second_item.position_counts
+            )
@@ -23,6 +23,11 @@ class MockEveFile:
     def __init__(self):
         self.monitors = {
             "SimMonitor:01.STAT": MockMonitor(name="Status"),
+            "SimMonitor:02.STAT": MockMonitor(
+                milliseconds=np.asarray([-1, 3000, 4500]),
+                data=np.random.random(3),
+                name="Status",
+            ),
         }
         self.position_timestamps = evefile.entities.data.TimestampData()
         self.position_timestamps.position_counts = np.arange(1, 11)
@@ -107,3 +112,48 @@ class TestMapper(unittest.TestCase):
             self.mapper.file.monitors[self.monitor_name].data[1],
             mapped_data.data[0],
         )
+
+    def test_map_without_duplicate_times_returns_copy_of_all_data(self):
+        self.evefile.monitors[self.monitor_name].milliseconds = np.asarray(
+            [-1, 1500, 2000, 6200, 9100]
+        )
+        self.mapper.file = self.evefile
+        mapped_data = self.mapper.map(self.monitor_name)
+        np.testing.assert_array_equal(
+            self.mapper.file.monitors[self.monitor_name].data,
+            mapped_data.data,
+        )
+        self.assertIsNot(
+            mapped_data.data,
+            self.mapper.file.monitors[self.monitor_name].data,
+        )
+        np.testing.assert_array_equal(
+            [1, 2, 2, 7, 10], mapped_data.position_counts
+        )
+
+    def test_map_all_without_evefile_raises(self):
+        self.mapper.file = None
+        with self.assertRaisesRegex(
+            ValueError, "Need an evefile to map data."
+        ):
+            self.mapper.map_all()
+
+    def test_map_all_returns_same_as_map(self):
+        self.mapper.file = self.evefile
+        mapped_data = self.mapper.map_all(list(self.evefile.monitors))
+        for monitor, item in zip(self.evefile.monitors, mapped_data):
+            with self.subTest(monitor=monitor):
+                expected = self.mapper.map(monitor)
+                np.testing.assert_array_equal(expected.data, item.data)
+                np.testing.assert_array_equal(
+                    expected.position_counts, item.position_counts
+                )
+
+    def test_map_all_without_monitors_maps_all_monitors(self):
+        self.mapper.file = self.evefile
+        mapped_data = self.mapper.map_all()
+        self.assertEqual(len(self.evefile.monitors), len(mapped_data))
+
+    def test_map_all_with_empty_list_returns_empty_list(self):
+        self.mapper.file = self.evefile
+        self.assertEqual([], self.mapper.map_all([]))
@@ -37,6 +37,9 @@ class MockHDF5Dataset(MockHDF5Item):
     def get_data(self):
         self.get_data_called = True
 
+    def get_first_row(self):
+        return self.data[0]
+
 
 class MockHDF5Group(MockHDF5Item):
     def __init__(self, name="", filename=""):
@@ -742,6 +745,10 @@ class TestVersionMapperFactory(unittest.TestCase):
                 "No mapper for version 0",
             )
 
+    def test_get_mapper_returns_new_mapper_for_each_call(self):
+        self.factory.eveh5 = self.eveh5
+        self.assertIsNot(self.factory.get_mapper(), self.factory.get_mapper())
+
     def test_get_mapper_sets_source_in_mapper(self):
         self.factory.eveh5 = self.eveh5
         mapper = self.factory.get_mapper()
@@ -778,6 +785,10 @@ class TestVersionMapper(unittest.TestCase):
         self.mapper.source = None
         self.mapper.map(source=MockEveH5(), destination=MockFile())
 
+    def test_get_dataset_name_returns_last_part_of_path(self):
+        dataset = MockHDF5Dataset(name="/c1/main/foobar")
+        self.assertEqual("foobar", self.mapper.get_dataset_name(dataset))
+
     def test_get_hdf5_dataset_importer_returns_importer(self):
         self.assertIsInstance(
             self.mapper.get_hdf5_dataset_importer(dataset=MockHDF5Dataset()),
@@ -929,6 +940,21 @@ class TestVersionMapperV5(unittest.TestCase):
         )
         self.assertEqual(message, self.destination.log_messages[0].message)
 
+    def test_map_adds_log_messages_stored_as_objects(self):
+        log_messages = [
+            b"2024-07-25T10:04:03: Lorem ipsum",
+            "2024-07-25T10:05:23: dolor sit \u00e4met".encode(),
+        ]
+        self.mapper.source = self.source
+        self.mapper.source.LiveComment = MockHDF5Dataset()
+        self.mapper.source.LiveComment.data = np.asarray(
+            log_messages, dtype=object
+        )
+        self.mapper.map(destination=self.destination)
+        self.assertEqual(
+            "dolor sit \u00e4met", self.destination.log_messages[1].message
+        )
+
     def test_map_adds_monitor_datasets(self):
         self.mapper.source = self.source
         monitor1 = MockHDF5Dataset(name="/device/monitor")
@@ -1320,6 +1346,20 @@ class TestVersionMapperV5(unittest.TestCase):
         self.mapper.map(destination=self.destination)
         self.assertNotIn("axis1", self.mapper.datasets2map_in_main)
 
+    def test_map_axis_datasets_maps_datasets_in_order_of_names(self):
+        self.mapper.source = self.source
+        for name in ["axis2", "axis1"]:
+            axis = MockHDF5Dataset(name=f"/c1/main/{name}")
+            axis.attributes = {
+                "Name": name,
+                "Access": "ca:foobar",
+                "DeviceType": "Axis",
+            }
+            # noinspection PyUnresolvedReferences
+            self.mapper.source.c1.main.add_item(axis)
+        self.mapper.map(destination=self.destination)
+        self.assertListEqual(["axis1", "axis2"], list(self.destination.data))
+
     # noinspection PyUnresolvedReferences
     def test_map_singlepoint_datasets_removes_from_list2map(self):
         self.mapper.source = self.source
@@ -492,6 +492,37 @@ class TestMeasureData(unittest.TestCase):
         np.testing.assert_array_equal(positions, data_.position_counts)
         self.assertIsInstance(data_.data, np.ma.MaskedArray)
 
+    def test_join_with_positions_superset_masks_only_new_positions(self):
+        self.data.data = np.asarray(["foo", "bar", "baz"])
+        self.data.position_counts = np.asarray([3, 4, 5], dtype=np.int64)
+        positions = np.asarray([2, 3, 4, 5, 6], dtype=np.int64)
+        data_ = copy.copy(self.data)
+        data_.join(positions=positions)
+        np.testing.assert_array_equal(self.data.data, data_.data[1:4])
+        np.testing.assert_array_equal(
+            [True, False, False, False, True], data_.data.mask
+        )
+
+
+    def test_join_with_positions_superset_masks_missing_positions(self):
+        self.data.data = np.asarray([10, 50])
+        self.data.position_counts = np.asarray([1, 5], dtype=np.int64)
+        positions = np.asarray([0, 2, 5], dtype=np.int64)
+        data_ = copy.copy(self.data)
+        data_.join(positions=positions)
+        np.testing.assert_array_equal([True, True, False], data_.data.mask)
+        self.assertEqual(50, data_.data[2])
+
+    def test_join_with_positions_superset_ignores_trailing_positions(self):
+        self.data.data = np.asarray([10, 30, 70])
+        self.data.position_counts = np.asarray([1, 3, 7], dtype=np.int64)
+        positions = np.asarray([0, 1, 2, 3], dtype=np.int64)
+        data_ = copy.copy(self.data)
+        data_.join(positions=positions)
+        np.testing.assert_array_equal(
+            [True, False, True, False], data_.data.mask
+        )
+        np.testing.assert_array_equal([10, 30], data_.data.compressed())
 
 class TestDeviceData(unittest.TestCase):
     def setUp(self):
@@ -541,6 +572,18 @@ class TestDeviceData(unittest.TestCase):
         np.testing.assert_array_equal(data_.position_counts, positions)
         self.assertNotIsInstance(data_.data, np.ma.MaskedArray)
 
+    def test_join_with_positions_left_superset_masks(self):
+        self.data.data = np.random.random(3)
+        self.data.position_counts = np.asarray([3, 4, 5], dtype=np.int64)
+        positions = np.asarray([2, 3, 4, 5, 6], dtype=np.int64)
+        data_ = copy.copy(self.data)
+        data_.join(positions=positions)
+        np.testing.assert_array_equal(self.data.data, data_.data[1:4])
+        self.assertEqual(self.data.data[-1], data_.data[-1])
+        np.testing.assert_array_equal(
+            [True, False, False, False, False], data_.data.mask
+        )
+
 
 class TestAxisData(unittest.TestCase):
     def setUp(self):
@@ -651,6 +694,16 @@ class TestAxisData(unittest.TestCase):
         np.testing.assert_array_equal(positions, data_.position_counts)
         self.assertIsInstance(data_.data, np.ma.MaskedArray)
 
+    def test_join_with_positions_left_superset_and_fill_masks_first(self):
+        self.data.data = np.random.random(3)
+        self.data.position_counts = np.asarray([3, 4, 5], dtype=np.int64)
+        positions = np.asarray([1, 2, 3, 4, 5, 6], dtype=np.int64)
+        data_ = copy.copy(self.data)
+        data_.join(positions=positions, fill=True)
+        np.testing.assert_array_equal(
+            [True, True, False, False, False, False], data_.data.mask
+        )
+
     def test_join_with_positions_right_superset_and_fill_fills(self):
         self.data.data = np.random.random(3)
         self.data.position_counts = np.asarray([3, 4, 5], dtype=np.int64)
@@ -831,6 +884,14 @@ class TestTimestampData(unittest.TestCase):
             self.data.get_position([-1, 3.2, 5.5, 6.8]),
         )
 
+    def test_get_position_before_first_time_returns_first_position(self):
+        self.data.position_counts = np.linspace(start=4, stop=23, num=20)
+        self.data.data = np.linspace(start=2, stop=21, num=20)
+        np.testing.assert_array_equal(
+            self.data.position_counts[[0, 0, 1]],
+            self.data.get_position([-1, 1.5, 3.2]),
+        )
+
 
 class TestSinglePointChannelData(unittest.TestCase):
     def setUp(self):
@@ -1650,3 +1711,36 @@ class TestHDF5DataImporter(unittest.TestCase):
         self.importer.item = self.item
         self.importer.load()
         np.testing.assert_array_equal(np.ones([5, 2]), self.importer.data)
+
+    def test_load_within_context_keeps_file_open(self):
+        self.create_hdf5_file()
+        self.importer.source = self.filename
+        self.importer.item = self.item
+        with data.HDF5DataImporter.keep_files_open():
+            self.importer.load()
+            files = data.HDF5DataImporter._open_files.files
+            self.assertTrue(files[self.filename])
+        self.assertFalse(files[self.filename])
+
+    def test_load_within_context_shares_open_file(self):
+        self.create_hdf5_file()
+        importer = data.HDF5DataImporter(source=self.filename)
+        self.importer.source = self.filename
+        with data.HDF5DataImporter.keep_files_open():
+            self.importer.load(item=self.item)
+            file = data.HDF5DataImporter._open_files.files[self.filename]
+            importer.load(item=self.item)
+            self.assertIs(
+                file, data.HDF5DataImporter._open_files.files[self.filename]
+            )
+        np.testing.assert_array_equal(np.ones([5, 2]), importer.data)
+
+    def test_nested_contexts_close_files_only_at_outermost(self):
+        self.create_hdf5_file()
+        self.importer.source = self.filename
+        with data.HDF5DataImporter.keep_files_open():
+            with data.HDF5DataImporter.keep_files_open():
+                self.importer.load(item=self.item)
+            file = data.HDF5DataImporter._open_files.files[self.filename]
+            self.assertTrue(file)
+        self.assertFalse(file)
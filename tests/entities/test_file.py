@@ -88,6 +88,10 @@ class TestLogMessage(unittest.TestCase):
         )
         self.assertEqual(message, self.log_message.message)
 
+    def test_from_string_returns_log_message(self):
+        string = "2024-07-25T10:04:03: Lorem ipsum"
+        self.assertIs(self.log_message, self.log_message.from_string(string))
+
     def test_print_prints_log_message(self):
         string = "2024-07-25T10:04:03: Lorem ipsum"
         self.log_message.from_string(string)